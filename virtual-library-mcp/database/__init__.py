@@ -20,6 +20,7 @@ from .patron_repository import PatronRepository
 from .repository import (
     BaseRepository,
     DuplicateError,
+    InvalidCursorError,
     NotFoundError,
     PaginatedResponse,
     PaginationParams,
@@ -33,6 +34,7 @@ from .schema import (
     CirculationStatusEnum,
     Patron,
     PatronStatusEnum,
+    PopularBook,
     ReservationRecord,
     ReservationStatusEnum,
     ReturnRecord,
@@ -58,12 +60,14 @@ __all__ = [
     "CirculationStatusEnum",
     "DatabaseManager",
     "DuplicateError",
+    "InvalidCursorError",
     "NotFoundError",
     "PaginatedResponse",
     "PaginationParams",
     "Patron",
     "PatronRepository",
     "PatronStatusEnum",
+    "PopularBook",
     "RepositoryException",
     "ReservationRecord",
     "ReservationStatusEnum",
@@ -17,13 +17,21 @@ to simulate realistic library operations where business hours, due dates, and
 patron interactions occur in local time.
 """
 
+import base64
+import binascii
 import enum
+import json
+import re
+import weakref
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel
-from sqlalchemy import and_, func, or_, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, column, func, literal_column, or_, select, table, tuple_
+from sqlalchemy.orm import Session, contains_eager, joinedload
 
+from database.schema import BOOK_SEARCH_INDEX
 from database.schema import Author as AuthorDB
 from database.schema import Book as BookDB
 from database.session import mcp_safe_commit, mcp_safe_query
@@ -33,6 +41,7 @@ from observability.context import trace_repository_operation
 from .repository import (
     BaseRepository,
     DuplicateError,
+    InvalidCursorError,
     NotFoundError,
     PaginatedResponse,
     PaginationParams,
@@ -58,18 +67,20 @@ class BookUpdateSchema(BaseModel):
     cover_url: str | None = None
 
 
-class BookSearchParams(BaseModel):
+@dataclass(frozen=True, slots=True)
+class BookSearchParams:
     """
     Search parameters for finding books.
 
     These parameters map directly to MCP resource query parameters,
-    enabling flexible book discovery through the protocol.
+    enabling flexible book discovery through the protocol. Callers pass
+    already-validated values, so this is a plain dataclass, not a model.
     """
 
     query: str | None = None  # General search term
     title: str | None = None  # Title contains
     author_name: str | None = None  # Author name contains
-    genre: str | None = None  # Exact genre match
+    genre: str | None = None  # Exact genre match (case-insensitive)
     isbn: str | None = None  # ISBN exact or partial match
     available_only: bool = False  # Only show available books
     publication_year_from: int | None = None
@@ -88,6 +99,136 @@ class BookSortOptions(enum.StrEnum):
     UPDATED_AT = "updated_at"
 
 
+_TIMESTAMP_SORTS = frozenset({BookSortOptions.CREATED_AT, BookSortOptions.UPDATED_AT})
+
+# Column each sort option orders by; built once rather than per query
+_SORT_COLUMNS = {
+    BookSortOptions.TITLE: BookDB.title,
+    BookSortOptions.AUTHOR: AuthorDB.name,
+    BookSortOptions.PUBLICATION_YEAR: BookDB.publication_year,
+    BookSortOptions.AVAILABILITY: BookDB.available_copies,
+    BookSortOptions.GENRE: BookDB.genre,
+    BookSortOptions.CREATED_AT: BookDB.created_at,
+    BookSortOptions.UPDATED_AT: BookDB.updated_at,
+}
+# Sorts on a nullable column (updated_at): NULLs are ordered explicitly
+# (first ascending, last descending) and the keyset seek handles them apart,
+# since a row comparison against NULL is never true
+_NULLABLE_SORTS = frozenset(option for option, col in _SORT_COLUMNS.items() if col.nullable)
+# Genre listings never join authors, so they offer a narrower set
+_GENRE_SORT_COLUMNS = {
+    BookSortOptions.TITLE: BookDB.title,
+    BookSortOptions.PUBLICATION_YEAR: BookDB.publication_year,
+    BookSortOptions.AVAILABILITY: BookDB.available_copies,
+}
+
+
+def _sort_value(book: BookDB, sort_by: BookSortOptions) -> Any:
+    """The value a row sorts by (the author is eagerly loaded)."""
+    if sort_by == BookSortOptions.AUTHOR:
+        return book.author.name
+    if sort_by == BookSortOptions.AVAILABILITY:
+        return book.available_copies
+    return getattr(book, sort_by.value)
+
+
+def _encode_search_cursor(
+    sort_by: BookSortOptions, sort_desc: bool, last_value: Any, last_isbn: str
+) -> str:
+    """Mint an opaque keyset cursor: the sort key of the last row served.
+
+    The cursor records the ordering it was minted for, so it can't be
+    replayed against a different sort and silently skip or repeat rows.
+    """
+    if isinstance(last_value, datetime):
+        last_value = last_value.isoformat()
+    payload = {"s": sort_by.value, "d": sort_desc, "v": last_value, "i": last_isbn}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+# What a decoded cursor's sort value may be (timestamps are already parsed)
+_CURSOR_VALUE_TYPES = (str, int, float, datetime, type(None))
+
+
+def _decode_search_cursor(
+    cursor: str, sort_by: BookSortOptions, sort_desc: bool
+) -> tuple[Any, str]:
+    """Open a keyset cursor into (last sort value, last ISBN)."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        cursor_sort, cursor_desc = payload["s"], payload["d"]
+        value, isbn = payload["v"], payload["i"]
+        if value is not None and sort_by in _TIMESTAMP_SORTS:
+            value = datetime.fromisoformat(value)
+    except (ValueError, TypeError, KeyError, binascii.Error) as e:
+        raise InvalidCursorError("Malformed search cursor") from e
+    if cursor_sort != sort_by.value or cursor_desc != sort_desc:
+        raise InvalidCursorError("Search cursor was issued for a different sort order")
+    if not isinstance(isbn, str) or not isinstance(value, _CURSOR_VALUE_TYPES):
+        raise InvalidCursorError("Malformed search cursor")
+    if value is None and sort_by not in _NULLABLE_SORTS:
+        raise InvalidCursorError("Malformed search cursor")
+    return value, isbn
+
+
+def _seek_past(sort_field: Any, sort_desc: bool, last_value: Any, last_isbn: str) -> Any:
+    """WHERE clause selecting the rows after (last_value, last_isbn) in sort order.
+
+    NULL sort values come first ascending and last descending (see
+    _NULLABLE_SORTS), so a NULL on either side gets its own branch.
+    """
+    if last_value is None:
+        # Still among the NULLs: the rest of them by ISBN, then (ascending
+        # only) every non-NULL row
+        if sort_desc:
+            return and_(sort_field.is_(None), BookDB.isbn < last_isbn)
+        return or_(and_(sort_field.is_(None), BookDB.isbn > last_isbn), sort_field.is_not(None))
+    key = tuple_(sort_field, BookDB.isbn)
+    bound = tuple_(last_value, last_isbn)
+    if sort_desc:
+        return or_(key < bound, sort_field.is_(None))  # NULLs still to come
+    return key > bound  # NULLs were already served
+
+
+_book_fts = table(BOOK_SEARCH_INDEX, column("isbn"))
+
+# Engines known to have the books_fts index. Only positive answers are
+# remembered: a database created before the index existed gains it the next
+# time init_database runs, and searches pick it up without a restart.
+_fts_engines: weakref.WeakSet = weakref.WeakSet()
+
+
+def _has_book_search_index(session: Session) -> bool:
+    """Whether the session's database has the books_fts full-text index."""
+    engine = session.get_bind().engine
+    if engine in _fts_engines:
+        return True
+    if engine.dialect.name != "sqlite":
+        return False
+    found = session.execute(
+        select(literal_column("1"))
+        .select_from(table("sqlite_master"))
+        .where(column("type") == "table", column("name") == BOOK_SEARCH_INDEX)
+    ).first()
+    if found is None:
+        return False
+    _fts_engines.add(engine)
+    return True
+
+
+def _fts_match_expression(query: str) -> str | None:
+    """Turn free text into an FTS5 MATCH expression, or None if it has no words.
+
+    Every word becomes a quoted prefix term ("gats"* matches "Gatsby"), so
+    user input can never be parsed as FTS5 syntax (AND/OR/NEAR, column
+    filters, a stray quote); terms are implicitly ANDed.
+    """
+    words = re.findall(r"\w+", query)
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
 class BookRepository(BaseRepository[BookDB, BookCreateSchema, BookUpdateSchema, BookModel]):
     """
     Repository for book data access.
@@ -113,6 +254,7 @@ class BookRepository(BaseRepository[BookDB, BookCreateSchema, BookUpdateSchema,
         pagination: PaginationParams | None = None,
         sort_by: BookSortOptions = BookSortOptions.TITLE,
         sort_desc: bool = False,
+        cursor: str | None = None,
     ) -> PaginatedResponse[BookModel]:
         """
         Search for books with various filters.
@@ -134,23 +276,43 @@ class BookRepository(BaseRepository[BookDB, BookCreateSchema, BookUpdateSchema,
             pagination: Pagination parameters
             sort_by: Field to sort by
             sort_desc: Sort in descending order
+            cursor: next_cursor from a previous page of the same search. Seeks
+                straight past the last row served (keyset pagination) instead
+                of counting through OFFSET rows; pagination.page is then only
+                echoed back.
 
         Returns:
-            Paginated response with matching books
+            Paginated response with matching books; next_cursor is set when
+            another page follows
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was minted for
+                a different sort order
         """
-        # Build base query with author join for author name search
-        query = select(BookDB).join(AuthorDB, BookDB.author_id == AuthorDB.id)
+        query = select(BookDB)
 
         # Apply filters
         filters = []
 
-        # General search across multiple fields
+        # General search across multiple fields. Title and description go
+        # through the FTS5 index when the database has one; ISBN and author
+        # name are short enough to keep matching as substrings.
         if search_params.query:
             search_term = f"%{search_params.query}%"
+            match_expression = _fts_match_expression(search_params.query)
+            if match_expression and _has_book_search_index(self.session):
+                text_match = BookDB.isbn.in_(
+                    select(_book_fts.c.isbn).where(
+                        literal_column(BOOK_SEARCH_INDEX).match(match_expression)
+                    )
+                )
+            else:
+                text_match = or_(
+                    BookDB.title.ilike(search_term), BookDB.description.ilike(search_term)
+                )
             filters.append(
                 or_(
-                    BookDB.title.ilike(search_term),
-                    BookDB.description.ilike(search_term),
+                    text_match,
                     BookDB.isbn.like(search_term),
                     AuthorDB.name.ilike(search_term),
                 )
@@ -164,7 +326,7 @@ class BookRepository(BaseRepository[BookDB, BookCreateSchema, BookUpdateSchema,
             filters.append(AuthorDB.name.ilike(f"%{search_params.author_name}%"))
 
         if search_params.genre:
-            filters.append(BookDB.genre == search_params.genre)
+            filters.append(func.lower(BookDB.genre) == search_params.genre.lower())
 
         if search_params.isbn:
             # Support both exact and partial ISBN matching
@@ -182,22 +344,31 @@ class BookRepository(BaseRepository[BookDB, BookCreateSchema, BookUpdateSchema,
         if search_params.publication_year_to:
             filters.append(BookDB.publication_year <= search_params.publication_year_to)
 
+        # Join authors only when a filter or the sort reads them
+        join_author = bool(
+            search_params.query or search_params.author_name or sort_by == BookSortOptions.AUTHOR
+        )
+        if join_author:
+            query = query.join(AuthorDB, BookDB.author_id == AuthorDB.id)
+
         # Apply all filters
         if filters:
             query = query.where(and_(*filters))
 
         # Apply sorting
-        sort_field = {
-            BookSortOptions.TITLE: BookDB.title,
-            BookSortOptions.AUTHOR: AuthorDB.name,
-            BookSortOptions.PUBLICATION_YEAR: BookDB.publication_year,
-            BookSortOptions.AVAILABILITY: BookDB.available_copies,
-            BookSortOptions.GENRE: BookDB.genre,
-            BookSortOptions.CREATED_AT: BookDB.created_at,
-            BookSortOptions.UPDATED_AT: BookDB.updated_at,
-        }.get(sort_by, BookDB.title)
-
-        query = query.order_by(sort_field.desc() if sort_desc else sort_field.asc())
+        sort_field = _SORT_COLUMNS.get(sort_by, BookDB.title)
+
+        # ISBN breaks ties, so the order (and therefore a keyset) is total
+        if sort_desc:
+            sort_order = sort_field.desc()
+            if sort_by in _NULLABLE_SORTS:
+                sort_order = sort_order.nulls_last()
+            query = query.order_by(sort_order, BookDB.isbn.desc())
+        else:
+            sort_order = sort_field.asc()
+            if sort_by in _NULLABLE_SORTS:
+                sort_order = sort_order.nulls_first()
+            query = query.order_by(sort_order, BookDB.isbn.asc())
 
         # Handle pagination
         if not pagination:
@@ -205,10 +376,11 @@ class BookRepository(BaseRepository[BookDB, BookCreateSchema, BookUpdateSchema,
 
         pagination.validate_params()
 
-        # Get total count
-        count_query = (
-            select(func.count()).select_from(BookDB).join(AuthorDB, BookDB.author_id == AuthorDB.id)
-        )
+        # Get total count: filters only, no ORDER BY, and the author join
+        # only when a filter needs it (the sort alone doesn't change the count)
+        count_query = select(func.count()).select_from(BookDB)
+        if search_params.query or search_params.author_name:
+            count_query = count_query.join(AuthorDB, BookDB.author_id == AuthorDB.id)
         if filters:
             count_query = count_query.where(and_(*filters))
 
@@ -219,16 +391,34 @@ class BookRepository(BaseRepository[BookDB, BookCreateSchema, BookUpdateSchema,
             or 0
         )
 
-        # Apply pagination to main query
-        query = query.offset(pagination.offset).limit(pagination.page_size)
-
-        # Execute query with eager loading of author
-        query = query.options(joinedload(BookDB.author))
+        # Apply pagination to main query: seek past the cursor's row, or
+        # skip OFFSET rows. One extra row tells us whether a page follows.
+        if cursor:
+            last_value, last_isbn = _decode_search_cursor(cursor, sort_by, sort_desc)
+            query = query.where(_seek_past(sort_field, sort_desc, last_value, last_isbn))
+        else:
+            query = query.offset(pagination.offset)
+        query = query.limit(pagination.page_size + 1)
+
+        # Execute query with eager loading of author, reusing the join if
+        # there is one rather than joining authors a second time
+        query = query.options(
+            contains_eager(BookDB.author) if join_author else joinedload(BookDB.author)
+        )
         results = mcp_safe_query(
             self.session,
             lambda s: s.execute(query).unique().scalars().all(),
             "Failed to search books",
         )
+        has_next = len(results) > pagination.page_size
+        results = results[: pagination.page_size]
+
+        next_cursor = None
+        if has_next:
+            last = results[-1]
+            next_cursor = _encode_search_cursor(
+                sort_by, sort_desc, _sort_value(last, sort_by), last.isbn
+            )
 
         # Convert to Pydantic models
         items = [self._to_response_model(book) for book in results]
@@ -239,8 +429,9 @@ class BookRepository(BaseRepository[BookDB, BookCreateSchema, BookUpdateSchema,
             page=pagination.page,
             page_size=pagination.page_size,
             total_pages=(total + pagination.page_size - 1) // pagination.page_size,
-            has_next=pagination.page * pagination.page_size < total,
-            has_previous=pagination.page > 1,
+            has_next=has_next,
+            has_previous=bool(cursor) or pagination.page > 1,
+            next_cursor=next_cursor,
         )
 
     def get_by_isbn(self, isbn: str) -> BookModel | None:
@@ -256,22 +447,49 @@ class BookRepository(BaseRepository[BookDB, BookCreateSchema, BookUpdateSchema,
             Book model or None if not found
         """
         with trace_repository_operation("book", "get_by_isbn", "books"):
-            # Normalize ISBN by removing hyphens
-            normalized_isbn = isbn.replace("-", "")
+            result = self._get_db_book_with_author(isbn)
 
-            query = select(BookDB).where(BookDB.isbn == normalized_isbn)
-            query = query.options(joinedload(BookDB.author))
+            if result is None:
+                return None
 
-            result = mcp_safe_query(
-                self.session,
-                lambda s: s.execute(query).unique().scalar_one_or_none(),
-                "Failed to get book by ISBN",
-            )
+            return self._to_response_model(result)
+
+    def get_by_isbn_with_author_name(self, isbn: str) -> tuple[BookModel, str] | None:
+        """
+        Get book by ISBN together with its author's name.
+
+        The author is joined into the same SELECT, so callers that display
+        "Title by Author" don't need a second AuthorRepository round trip.
+
+        Args:
+            isbn: ISBN-13 (with or without hyphens)
+
+        Returns:
+            (book, author_name) or None if not found. author_name is
+            "Unknown Author" when the author row is missing.
+        """
+        with trace_repository_operation("book", "get_by_isbn_with_author_name", "books"):
+            result = self._get_db_book_with_author(isbn)
 
             if result is None:
                 return None
 
-            return self._to_response_model(result)
+            author_name = result.author.name if result.author else "Unknown Author"
+            return self._to_response_model(result), author_name
+
+    def _get_db_book_with_author(self, isbn: str) -> BookDB | None:
+        """Load a book row by ISBN with its author eagerly joined."""
+        # Normalize ISBN by removing hyphens
+        normalized_isbn = isbn.replace("-", "")
+
+        query = select(BookDB).where(BookDB.isbn == normalized_isbn)
+        query = query.options(joinedload(BookDB.author))
+
+        return mcp_safe_query(
+            self.session,
+            lambda s: s.execute(query).unique().scalar_one_or_none(),
+            "Failed to get book by ISBN",
+        )
 
     def get_by_author(
         self,
@@ -321,19 +539,12 @@ class BookRepository(BaseRepository[BookDB, BookCreateSchema, BookUpdateSchema,
         Returns:
             Paginated list of books
         """
-        # Normalize genre to match database storage
-        normalized_genre = genre.strip().title()
-
-        query = select(BookDB).where(BookDB.genre == normalized_genre)
+        # Case-insensitive match, served by the lower(genre) index
+        query = select(BookDB).where(func.lower(BookDB.genre) == genre.strip().lower())
         query = query.options(joinedload(BookDB.author))
 
         # Apply sorting
-        sort_map = {
-            BookSortOptions.TITLE: BookDB.title,
-            BookSortOptions.PUBLICATION_YEAR: BookDB.publication_year,
-            BookSortOptions.AVAILABILITY: BookDB.available_copies,
-        }
-        query = query.order_by(sort_map.get(sort_by, BookDB.title))
+        query = query.order_by(_GENRE_SORT_COLUMNS.get(sort_by, BookDB.title))
 
         return self._paginate_query(query, pagination)
 
@@ -487,8 +698,8 @@ class BookRepository(BaseRepository[BookDB, BookCreateSchema, BookUpdateSchema,
 
         pagination.validate_params()
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
+        # Get total count (ordering can't change it, so don't make the DB sort)
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
         total = (
             mcp_safe_query(
                 self.session,
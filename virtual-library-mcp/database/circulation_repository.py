@@ -352,6 +352,35 @@ class CirculationRepository:
             NotFoundError: If patron or book not found
             RepositoryException: If reservation not allowed
         """
+        reservation = self._new_reservation(reservation_data)
+        self._save_reservation(reservation)
+        return self._reservation_to_model(reservation)
+
+    def create_reservation_with_queue(
+        self, reservation_data: ReservationCreateSchema
+    ) -> tuple[ReservationModel, ReservationQueueInfo]:
+        """
+        Create a book reservation and report the book's queue in one transaction.
+
+        The queue is read after the new reservation is flushed but before the
+        commit, so the caller gets both without a second transaction.
+
+        Args:
+            reservation_data: Reservation creation data
+
+        Returns:
+            Created reservation record and the queue information including it
+
+        Raises:
+            NotFoundError: If patron or book not found
+            RepositoryException: If reservation not allowed
+        """
+        reservation = self._new_reservation(reservation_data)
+        queue_info = self._save_reservation(reservation, with_queue_info=True)
+        return self._reservation_to_model(reservation), queue_info
+
+    def _new_reservation(self, reservation_data: ReservationCreateSchema) -> ReservationDB:
+        """Validate a reservation request and build its (unsaved) record."""
         # Validate patron
         patron = mcp_safe_query(
             self.session,
@@ -429,32 +458,37 @@ class CirculationRepository:
             datetime.now().date() + timedelta(days=90)
         )
 
-        # Generate reservation ID
-        reservation_id = self._generate_reservation_id()
+        # Update patron activity
+        patron.last_activity = datetime.now()
+        patron.updated_at = datetime.now()
+
+        return ReservationDB(
+            id=self._generate_reservation_id(),
+            patron_id=reservation_data.patron_id,
+            book_isbn=reservation_data.book_isbn,
+            reservation_date=datetime.now(),
+            expiration_date=expiration_date,
+            status=ReservationStatusEnum.PENDING,
+            queue_position=max_position + 1,
+            notes=reservation_data.notes,
+        )
 
+    def _save_reservation(
+        self, reservation: ReservationDB, *, with_queue_info: bool = False
+    ) -> ReservationQueueInfo | None:
+        """Insert and commit a reservation, optionally reading its queue first."""
         try:
-            # Create reservation
-            reservation = ReservationDB(
-                id=reservation_id,
-                patron_id=reservation_data.patron_id,
-                book_isbn=reservation_data.book_isbn,
-                reservation_date=datetime.now(),
-                expiration_date=expiration_date,
-                status=ReservationStatusEnum.PENDING,
-                queue_position=max_position + 1,
-                notes=reservation_data.notes,
-            )
             self.session.add(reservation)
-
-            # Update patron activity
-            patron.last_activity = datetime.now()
-            patron.updated_at = datetime.now()
+            queue_info = None
+            if with_queue_info:
+                self.session.flush()
+                queue_info = self.get_reservation_queue_info(reservation.book_isbn)
 
             # Commit transaction
             mcp_safe_commit(self.session, "create reservation")
             self.session.refresh(reservation)
 
-            return self._reservation_to_model(reservation)
+            return queue_info
 
         except IntegrityError as e:
             self.session.rollback()
@@ -640,58 +674,30 @@ class CirculationRepository:
         Returns:
             Queue information including estimated wait time
         """
-        # Count total reservations
-        total_reservations = (
-            mcp_safe_query(
-                self.session,
-                lambda s: s.execute(
-                    select(func.count())
-                    .select_from(ReservationDB)
-                    .where(ReservationDB.book_isbn == book_isbn)
-                ).scalar(),
-                "Failed to count total reservations",
-            )
-            or 0
-        )
-
-        # Count pending reservations
-        pending_reservations = (
-            mcp_safe_query(
-                self.session,
-                lambda s: s.execute(
-                    select(func.count())
-                    .select_from(ReservationDB)
-                    .where(
-                        and_(
-                            ReservationDB.book_isbn == book_isbn,
-                            ReservationDB.status == ReservationStatusEnum.PENDING,
-                        )
-                    )
-                ).scalar(),
-                "Failed to count pending reservations",
-            )
-            or 0
+        # Both counts and the copy count come back from one statement
+        total_reservations, pending_reservations, total_copies = mcp_safe_query(
+            self.session,
+            lambda s: s.execute(
+                select(
+                    func.count(ReservationDB.id),
+                    func.count(ReservationDB.id).filter(
+                        ReservationDB.status == ReservationStatusEnum.PENDING
+                    ),
+                    select(BookDB.total_copies).where(BookDB.isbn == book_isbn).scalar_subquery(),
+                ).where(ReservationDB.book_isbn == book_isbn)
+            ).one(),
+            "Failed to get reservation queue counts",
         )
 
         # Estimate wait time based on average loan period (14 days) and queue position
         # This is a simplified estimate - in production, could use historical data
         estimated_wait_days = None
-        if pending_reservations > 0:
-            # Get number of copies to calculate turnover rate
-            book = mcp_safe_query(
-                self.session,
-                lambda s: s.execute(
-                    select(BookDB).where(BookDB.isbn == book_isbn)
-                ).scalar_one_or_none(),
-                "Failed to get book for wait time calculation",
-            )
-
-            if book and book.total_copies > 0:
-                # Assume each copy has a 14-day loan period
-                # Wait time = (position in queue / number of copies) * loan period
-                estimated_wait_days = (pending_reservations // book.total_copies) * 14
-                if pending_reservations % book.total_copies > 0:
-                    estimated_wait_days += 14
+        if pending_reservations > 0 and total_copies:
+            # Assume each copy has a 14-day loan period
+            # Wait time = (position in queue / number of copies) * loan period
+            estimated_wait_days = (pending_reservations // total_copies) * 14
+            if pending_reservations % total_copies > 0:
+                estimated_wait_days += 14
 
         return ReservationQueueInfo(
             book_isbn=book_isbn,
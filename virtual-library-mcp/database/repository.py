@@ -18,6 +18,7 @@ add domain-specific queries needed by MCP Resources (read operations) and Tools
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Generic, TypeVar
 from uuid import UUID
 
@@ -48,8 +49,17 @@ class DuplicateError(RepositoryException):
     """Raised when attempting to create a duplicate entity."""
 
 
-class PaginationParams(BaseModel):
-    """Standard pagination parameters for MCP list operations."""
+class InvalidCursorError(RepositoryException):
+    """Raised when a pagination cursor is malformed or doesn't fit the query."""
+
+
+@dataclass(frozen=True, slots=True)
+class PaginationParams:
+    """Standard pagination parameters for MCP list operations.
+
+    A plain dataclass rather than a Pydantic model: it is built internally on
+    every list call and validate_params() does its only checking.
+    """
 
     page: int = 1
     page_size: int = 20
@@ -82,6 +92,8 @@ class PaginatedResponse(BaseModel, Generic[ResponseSchemaType]):
     total_pages: int
     has_next: bool
     has_previous: bool
+    # Opaque keyset cursor for the page after this one, where supported
+    next_cursor: str | None = None
 
 
 class BaseRepository(
@@ -30,6 +30,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     event,
+    text,
 )
 from sqlalchemy.orm import declarative_base, relationship, validates
 from sqlalchemy.sql import func
@@ -155,6 +156,8 @@ class Book(Base):
     __table_args__ = (
         Index("idx_book_title", "title"),
         Index("idx_book_genre", "genre"),
+        # Genre filters compare case-insensitively: lower(genre) = :genre
+        Index("idx_book_genre_lower", func.lower(text("genre"))),
         Index("idx_book_author", "author_id"),
         Index("idx_book_availability", "available_copies"),
         CheckConstraint("available_copies >= 0", name="check_available_copies_non_negative"),
@@ -277,7 +280,9 @@ class CheckoutRecord(Base):
     __table_args__ = (
         Index("idx_checkout_patron", "patron_id"),
         Index("idx_checkout_book", "book_isbn"),
-        Index("idx_checkout_status", "status"),
+        # Leads with status, so it also serves plain status filters; active
+        # loans past a due date become one range scan.
+        Index("idx_checkout_status_due_date", "status", "due_date"),
         Index("idx_checkout_due_date", "due_date"),
         CheckConstraint("id LIKE 'checkout_%'", name="check_checkout_id_format"),
         CheckConstraint("renewal_count >= 0 AND renewal_count <= 3", name="check_renewal_limit"),
@@ -375,6 +380,25 @@ class ReservationRecord(Base):
     )
 
 
+class PopularBook(Base):
+    """
+    Popular books table - the most-borrowed books, ranked by checkouts.
+
+    MCP Usage:
+    - Tools: regenerate_catalog rebuilds it wholesale from checkout history
+    - A cache: nothing else writes to it, and it can always be regenerated
+    """
+
+    __tablename__ = "popular_books"
+
+    book_isbn = Column(String(13), ForeignKey("books.isbn", ondelete="CASCADE"), primary_key=True)
+    checkout_count = Column(Integer, nullable=False)
+    rank = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, nullable=False, default=func.now())
+
+    __table_args__ = (Index("idx_popular_book_rank", "rank"),)
+
+
 # Database event listeners for MCP integration
 @event.listens_for(Book, "after_update")
 def book_after_update(mapper, connection, target):
@@ -400,3 +424,130 @@ def reservation_queue_update(mapper, connection, target):
     that requires coordination across multiple records.
     """
     # Queue management logic would go here
+
+
+# Full-text index over book titles and descriptions (SQLite FTS5).
+# The virtual table keeps its own copy of the text rather than pointing at
+# books' implicit rowid: books has a string primary key, and SQLite's VACUUM
+# is free to renumber such rowids, which would silently desynchronize an
+# external-content index. Instead books_fts_keys gives every ISBN a stable
+# INTEGER PRIMARY KEY that doubles as its books_fts rowid, so the triggers
+# find a book's index row by rowid (an indexed lookup) instead of scanning
+# the UNINDEXED isbn column. The update trigger fires only when the indexed
+# text changes, so circulation updates to available_copies never touch it.
+BOOK_SEARCH_INDEX = "books_fts"
+BOOK_SEARCH_KEYS = "books_fts_keys"
+
+_BOOK_SEARCH_TRIGGERS = ("books_fts_ai", "books_fts_ad", "books_fts_au")
+
+_BOOK_SEARCH_INDEX_DDL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS books_fts_ai AFTER INSERT ON books BEGIN
+        INSERT INTO books_fts_keys (isbn) VALUES (new.isbn);
+        INSERT INTO books_fts (rowid, isbn, title, description)
+        SELECT id, new.isbn, new.title, new.description
+        FROM books_fts_keys WHERE isbn = new.isbn;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS books_fts_ad AFTER DELETE ON books BEGIN
+        DELETE FROM books_fts
+        WHERE rowid = (SELECT id FROM books_fts_keys WHERE isbn = old.isbn);
+        DELETE FROM books_fts_keys WHERE isbn = old.isbn;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS books_fts_au
+    AFTER UPDATE OF isbn, title, description ON books BEGIN
+        DELETE FROM books_fts
+        WHERE rowid = (SELECT id FROM books_fts_keys WHERE isbn = old.isbn);
+        UPDATE books_fts_keys SET isbn = new.isbn WHERE isbn = old.isbn;
+        INSERT INTO books_fts (rowid, isbn, title, description)
+        SELECT id, new.isbn, new.title, new.description
+        FROM books_fts_keys WHERE isbn = new.isbn;
+    END
+    """,
+)
+
+
+def _fill_book_search_index(connection) -> None:
+    """Key every book and copy its text into books_fts (both start empty)."""
+    connection.exec_driver_sql(f"INSERT INTO {BOOK_SEARCH_KEYS} (isbn) SELECT isbn FROM books")
+    connection.exec_driver_sql(
+        f"INSERT INTO {BOOK_SEARCH_INDEX} (rowid, isbn, title, description) "
+        "SELECT k.id, b.isbn, b.title, b.description "
+        f"FROM books AS b JOIN {BOOK_SEARCH_KEYS} AS k ON k.isbn = b.isbn"
+    )
+
+
+def install_book_search_index(connection) -> None:
+    """
+    Create the books_fts index and its sync triggers if they are missing.
+
+    Idempotent, so it also upgrades databases created before the index
+    existed, or before it was keyed through books_fts_keys: a newly created
+    index is backfilled from the books table.
+    No-op on non-SQLite databases.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+
+    found = {
+        name
+        for (name,) in connection.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN (?, ?)",
+            (BOOK_SEARCH_INDEX, BOOK_SEARCH_KEYS),
+        )
+    }
+    if found != {BOOK_SEARCH_INDEX, BOOK_SEARCH_KEYS}:
+        # Missing, or the older isbn-keyed layout: start over
+        for trigger in _BOOK_SEARCH_TRIGGERS:
+            connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {BOOK_SEARCH_INDEX}")
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {BOOK_SEARCH_KEYS}")
+        connection.exec_driver_sql(
+            f"CREATE TABLE {BOOK_SEARCH_KEYS} "
+            "(id INTEGER PRIMARY KEY, isbn VARCHAR(13) NOT NULL UNIQUE)"
+        )
+        connection.exec_driver_sql(
+            f"CREATE VIRTUAL TABLE {BOOK_SEARCH_INDEX} "
+            "USING fts5(isbn UNINDEXED, title, description)"
+        )
+        _fill_book_search_index(connection)
+    for ddl in _BOOK_SEARCH_INDEX_DDL:
+        connection.exec_driver_sql(ddl)
+
+
+def rebuild_book_search_index(connection) -> None:
+    """
+    Repopulate books_fts from the books table in one set-based pass.
+
+    The triggers keep the index in sync, so this only matters after writes
+    that bypassed them (e.g. rows loaded before the index was installed).
+    No-op on non-SQLite databases.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+
+    install_book_search_index(connection)
+    connection.exec_driver_sql(f"DELETE FROM {BOOK_SEARCH_INDEX}")
+    connection.exec_driver_sql(f"DELETE FROM {BOOK_SEARCH_KEYS}")
+    _fill_book_search_index(connection)
+    # Merge the segments the refill left behind into a single b-tree
+    connection.exec_driver_sql(
+        f"INSERT INTO {BOOK_SEARCH_INDEX} ({BOOK_SEARCH_INDEX}) VALUES ('optimize')"
+    )
+
+
+@event.listens_for(Book.__table__, "after_create")
+def create_book_search_index(target, connection, **kw):  # noqa: ARG001
+    """Build the full-text index whenever create_all creates the books table."""
+    install_book_search_index(connection)
+
+
+@event.listens_for(Book.__table__, "before_drop")
+def drop_book_search_index(target, connection, **kw):  # noqa: ARG001
+    """Drop the full-text index with the books table (its triggers go with books)."""
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {BOOK_SEARCH_INDEX}")
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {BOOK_SEARCH_KEYS}")
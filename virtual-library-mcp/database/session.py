@@ -24,10 +24,11 @@ from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex
 
 from config import get_config
 
-from .schema import Base
+from .schema import Base, install_book_search_index
 
 # Configure logging for database operations
 logger = logging.getLogger(__name__)
@@ -76,30 +77,51 @@ class DatabaseManager:
         Get or create the database engine.
 
         The engine is created with:
-        - Connection pooling (StaticPool for SQLite)
+        - Connection pooling (QueuePool for SQLite files, StaticPool for
+          in-memory SQLite)
+        - WAL journaling and cache pragmas for file-backed SQLite
         - Foreign key constraints enabled for SQLite
         - Proper isolation level for concurrent access
         """
         if self._engine is None:
             # Configure engine based on database type
             if self.database_url.startswith("sqlite"):
-                # SQLite-specific configuration for MCP server use
+                in_memory = ":memory:" in self.database_url or self.database_url in (
+                    "sqlite://",
+                    "sqlite:///",
+                )
+                if in_memory:
+                    # An in-memory database lives and dies with its connection,
+                    # so every session must share that one connection
+                    pool_args = {"poolclass": StaticPool}
+                else:
+                    # File-backed: keep a pool of warm connections so concurrent
+                    # tool calls don't serialize on (or reopen) a single one.
+                    # WAL lets readers proceed alongside the writer.
+                    pool_args = {"pool_size": 10, "max_overflow": 20}
+
                 self._engine = create_engine(
                     self.database_url,
-                    # Use StaticPool to maintain a single connection
-                    # This prevents "database is locked" errors in SQLite
-                    poolclass=StaticPool,
-                    # Enable foreign key constraints
+                    **pool_args,
+                    # Pooled connections may be used from worker threads
                     connect_args={"check_same_thread": False},
                     # Echo SQL for debugging (disable in production)
                     echo=False,
                 )
 
-                # Enable foreign key constraints for SQLite
                 @event.listens_for(self._engine, "connect")
                 def set_sqlite_pragma(dbapi_connection, connection_record):  # noqa: ARG001
                     cursor = dbapi_connection.cursor()
+                    # Enable foreign key constraints for SQLite
                     cursor.execute("PRAGMA foreign_keys=ON")
+                    if not in_memory:
+                        cursor.execute("PRAGMA journal_mode=WAL")
+                        # Durable at checkpoints; safe with WAL, far fewer fsyncs
+                        cursor.execute("PRAGMA synchronous=NORMAL")
+                        cursor.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+                        cursor.execute("PRAGMA temp_store=MEMORY")
+                        # Wait for a competing writer instead of failing "locked"
+                        cursor.execute("PRAGMA busy_timeout=5000")
                     cursor.close()
             else:
                 # PostgreSQL or other databases
@@ -109,6 +131,8 @@ class DatabaseManager:
                     pool_size=10,
                     max_overflow=20,
                     pool_pre_ping=True,  # Verify connections before use
+                    # Replace connections before server-side idle timeouts do
+                    pool_recycle=1800,
                     echo=False,
                 )
 
@@ -195,6 +219,13 @@ class DatabaseManager:
 
         logger.info("Creating database tables...")
         Base.metadata.create_all(bind=engine)
+        # create_all skips existing tables, so bring indexes (and the
+        # full-text index) up to date for databases created before they existed
+        with engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+            install_book_search_index(conn)
         logger.info("Database initialization complete")
 
     def verify_connection(self) -> bool:
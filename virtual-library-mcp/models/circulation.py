@@ -64,7 +64,7 @@ class CheckoutRecord(BaseModel):
     book_isbn: str = Field(
         ...,
         description="ISBN of the checked out book",
-        pattern=r"^\d{13}$",
+        pattern=r"^[0-9]{13}$",
         examples=["9780134685479", "9780061120084"],
     )
 
@@ -271,7 +271,7 @@ class ReturnRecord(BaseModel):
     book_isbn: str = Field(
         ...,
         description="ISBN of the returned book",
-        pattern=r"^\d{13}$",
+        pattern=r"^[0-9]{13}$",
     )
 
     return_date: datetime = Field(
@@ -386,7 +386,7 @@ class ReservationRecord(BaseModel):
     book_isbn: str = Field(
         ...,
         description="ISBN of the reserved book",
-        pattern=r"^\d{13}$",
+        pattern=r"^[0-9]{13}$",
     )
 
     reservation_date: datetime = Field(
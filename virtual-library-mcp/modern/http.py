@@ -83,7 +83,6 @@ cancellation, basic/versioning (dual-era matrix).
 """
 
 import asyncio
-import json
 import logging
 import re
 from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
@@ -96,6 +95,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 from starlette.routing import BaseRoute, Mount, Route
 
+from modern import jsoncodec
 from modern.broker import ListenOutcome
 from modern.errors import (
     HeaderMismatchError,
@@ -104,6 +104,7 @@ from modern.errors import (
     McpError,
     ParseError,
 )
+from modern.jsoncodec import WireJSONResponse
 from modern.meta import decode_header_value
 from modern.types import (
     INTERNAL_ERROR,
@@ -210,11 +211,11 @@ def _sse_frame(payload: dict[str, Any]) -> str:
     ``id:`` field, ever — SSE event ids existed to feed ``Last-Event-ID``
     resumability, which 2026-07-28 removed (SEP-2575).
     """
-    return f"event: message\ndata: {json.dumps(payload)}\n\n"
+    return f"event: message\ndata: {jsoncodec.dumps(payload)}\n\n"
 
 
 def _json_error(payload: dict[str, Any], status: int) -> JSONResponse:
-    return JSONResponse(payload, status_code=status)
+    return WireJSONResponse(payload, status_code=status)
 
 
 def _status_for_response(response: dict[str, Any]) -> int:
@@ -742,7 +743,7 @@ def create_modern_asgi(
         # --- 3. Body: one JSON-RPC request or notification, never a batch --
         raw_body = await request.body()
         try:
-            parsed: Any = json.loads(raw_body)
+            parsed: Any = jsoncodec.loads(raw_body)
         except (ValueError, UnicodeDecodeError):
             exc = ParseError("Request body is not valid JSON")
             return _json_error(exc.to_error_response(None), exc.http_status)
@@ -876,7 +877,7 @@ def create_modern_asgi(
             return _SseResponse(_listen_frames(payload, keepalive_interval), cleanup)
         if kind == "none":
             return Response(status_code=202)
-        return _json_error(payload, status) if status != 200 else JSONResponse(payload)
+        return _json_error(payload, status) if status != 200 else WireJSONResponse(payload)
 
     routes: list[BaseRoute] = [Route(mcp_path, mcp_endpoint, methods=["POST"], name="mcp")]
     if extra_routes:
@@ -1052,20 +1053,20 @@ def create_dual_era_app(
 
         body, replay_receive = await _buffer_body(receive)
         try:
-            parsed = json.loads(body)
+            parsed = jsoncodec.loads(body)
         except (ValueError, UnicodeDecodeError):
             # Unparseable bodies cannot be classified by content; the header
             # rules below still apply and ambiguity falls to legacy, whose
             # own parser reports the error in its era's dialect.
             parsed = None
         if isinstance(parsed, list):
-            payload = json.dumps(
+            payload = jsoncodec.dumps_bytes(
                 error_response(
                     None,
                     INVALID_REQUEST,
                     "JSON-RPC batch requests are not supported by any served protocol version",
                 )
-            ).encode("utf-8")
+            )
             await _send_json(send, 400, payload)
             return
 
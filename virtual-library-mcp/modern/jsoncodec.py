@@ -0,0 +1,101 @@
+"""
+JSON encoding for the modern-era transports.
+
+Every JSON-RPC message crossing stdio or Streamable HTTP is parsed and
+serialized exactly once, and for tools that return long markdown (book
+insights, catalog reports) that encode step is a measurable slice of each
+request.  When the optional ``orjson`` package is installed (the ``speed``
+extra) these helpers use its C encoder, which writes UTF-8 ``bytes``
+directly — no intermediate ``str`` and no separate ``.encode()``.  Without
+it they fall back to the stdlib.
+
+Output is always compact (no spaces after separators) and keeps non-ASCII
+characters literal: both transports are UTF-8 on the wire, and compact
+JSON can never contain a raw newline, which the stdio framing relies on.
+
+The two backends are held to the same contract.  Both encode UUIDs as
+strings and enum members as their values; both reject datetimes and
+dataclasses with ``TypeError`` (convert them first, e.g. a Pydantic
+``model_dump(mode="json")``).  The one difference is non-finite floats:
+neither emits the non-standard ``NaN``/``Infinity`` tokens, but orjson
+writes ``null`` where the stdlib raises ``ValueError``.
+"""
+
+import enum
+import json
+import uuid
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _stdlib_default(obj: Any) -> Any:
+    """The types orjson encodes natively that the stdlib does not."""
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False, default=_stdlib_default
+    )
+
+
+def _stdlib_dumps_bytes(obj: Any) -> bytes:
+    return _stdlib_dumps(obj).encode("utf-8")
+
+
+if ORJSON_AVAILABLE:
+    # Datetimes and dataclasses are handed back (TypeError) rather than
+    # encoded natively, so they fail the same way the stdlib does.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson is stricter than the stdlib (e.g. ints beyond 64 bits);
+            # anything the stdlib can still encode is encoded the slow way.
+            return _stdlib_dumps_bytes(obj)
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return dumps_bytes(obj).decode("utf-8")
+
+    def loads(data: str | bytes) -> Any:
+        """Parse JSON text; raises ``ValueError`` on malformed input."""
+        return orjson.loads(data)
+
+else:
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+        return _stdlib_dumps_bytes(obj)
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return _stdlib_dumps(obj)
+
+    def loads(data: str | bytes) -> Any:
+        """Parse JSON text; raises ``ValueError`` on malformed input."""
+        return json.loads(data)
+
+
+class WireJSONResponse(JSONResponse):
+    """Starlette ``JSONResponse`` rendered through :func:`dumps_bytes`."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
@@ -52,12 +52,12 @@ basic/patterns/subscriptions; SEP-2575.
 
 import asyncio
 import contextlib
-import json
 import logging
 import sys
 from collections.abc import Awaitable, Callable
 from typing import Any
 
+from modern import jsoncodec
 from modern.dispatcher import Dispatcher, ListenOutcome, RequestEnv
 from modern.errors import InvalidRequestError, ParseError
 from modern.types import JSONRPC_VERSION
@@ -95,12 +95,12 @@ class ModernStdioServer:
         """Serialize one message as one line — atomically.
 
         Framing MUSTs: newline-delimited, no embedded newlines.
-        ``json.dumps`` never emits raw newlines, and the lock keeps
+        Compact JSON never contains raw newlines, and the lock keeps
         concurrent request tasks from interleaving partial lines.
         """
         if self._write_line is None:  # loop not running; drop silently
             return
-        line = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+        line = jsoncodec.dumps(message)
         async with self._write_lock:
             await self._write_line(line)
 
@@ -121,7 +121,7 @@ class ModernStdioServer:
                     continue
 
                 try:
-                    message = json.loads(line)
+                    message = jsoncodec.loads(line)
                 except ValueError:
                     # Unreadable body -> -32700 with NO id (we could not
                     # parse one out; the id key is omitted, never null).
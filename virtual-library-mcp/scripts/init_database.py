@@ -80,7 +80,7 @@ def main():
             )
             tables = [row[0] for row in result]
 
-            logger.info(f"Created tables: {', '.join(tables)}")
+            logger.info("Created tables: %s", ", ".join(tables))
 
             expected_tables = {
                 "authors",
@@ -93,14 +93,14 @@ def main():
 
             missing_tables = expected_tables - set(tables)
             if missing_tables:
-                logger.error(f"Missing expected tables: {missing_tables}")
+                logger.error("Missing expected tables: %s", missing_tables)
                 sys.exit(1)
 
         logger.info("✅ Database initialization complete!")
         logger.info("The Virtual Library MCP Server is ready to use.")
 
     except Exception as e:
-        logger.exception(f"Database initialization failed: {e}")
+        logger.exception("Database initialization failed: %s", e)
         sys.exit(1)
     finally:
         db_manager.close()
@@ -241,9 +241,9 @@ def load_sample_data(db_manager):
         )
         session.add(reservation)
 
-        logger.info(f"Created {len(authors)} authors")
-        logger.info(f"Created {len(books)} books")
-        logger.info(f"Created {len(patrons)} patrons")
+        logger.info("Created %d authors", len(authors))
+        logger.info("Created %d books", len(books))
+        logger.info("Created %d patrons", len(patrons))
         logger.info("Created 1 active checkout and 1 reservation")
 
 
@@ -25,11 +25,17 @@ Transports (VIRTUAL_LIBRARY_TRANSPORT):
   keep their GET/DELETE verbs; the modern era has neither (SEP-2567).
 """
 
+import asyncio
 import logging
+import queue
 import secrets as secrets_module
 import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from functools import partial
+from logging.handlers import QueueHandler, QueueListener
 
+import anyio
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 from starlette.requests import Request
@@ -52,6 +58,11 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[logging.StreamHandler(sys.stderr)],
 )
+# The log format above never shows thread or process details, so don't
+# look them up for every record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger(__name__)
 
 config = get_config()
@@ -284,8 +295,53 @@ def _run_http_server() -> None:
     uvicorn.run(app, host=config.http_host, port=config.http_port, log_level="info")
 
 
+def _uvloop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """uvloop's loop factory when the optional `speed` extra is installed.
+
+    The factory is handed to each transport's runner (anyio for stdio,
+    asyncio.run for stdio-modern) instead of being installed with
+    asyncio.set_event_loop_policy(), which is deprecated from Python 3.14.
+    uvicorn's default loop="auto" picks uvloop up on its own for http.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+@contextmanager
+def _queued_logging() -> Iterator[None]:
+    """Hand the root logger's output to a background listener thread.
+
+    While the server runs, handlers only enqueue records; the listener
+    formats and writes them, so tool calls (which audit-log every
+    operation) never wait on stderr. Leaving the block flushes the queue
+    and puts the original handlers back.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    enqueue = QueueHandler(log_queue)
+    enqueue.setFormatter(logging.Formatter("%(message)s"))  # the listener adds the rest
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root.handlers = [enqueue]
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        root.handlers = handlers
+
+
 def main() -> None:
     """Entry point: run the server on the configured transport."""
+    with _queued_logging():
+        _serve()
+
+
+def _serve() -> None:
+    """Start the configured transport and block until it stops."""
     logger.info(
         "%s v%s starting (transport=%s, debug=%s)",
         config.server_name,
@@ -299,19 +355,24 @@ def main() -> None:
     else:
         logging.getLogger("fastmcp").setLevel(logging.WARNING)
 
+    loop_factory = _uvloop_factory()
+    if loop_factory is not None:
+        logger.info("Using uvloop event loop")
+
     try:
         if config.transport == "stdio":
-            mcp.run(transport="stdio")
+            # mcp.run(transport="stdio"), with the loop factory passed through
+            anyio.run(
+                partial(mcp.run_async, "stdio"), backend_options={"loop_factory": loop_factory}
+            )
         elif config.transport == "stdio-modern":
             # The 2026-07-28 stateless protocol over newline-delimited
             # JSON-RPC. No handshake: the first request can be anything;
             # dual-era clients probe with server/discover (SEP-2575).
-            import asyncio
-
             from modern.stdio import run_stdio_modern
 
             dispatcher, _broker, _ = build_modern_stack()
-            asyncio.run(run_stdio_modern(dispatcher))
+            asyncio.run(run_stdio_modern(dispatcher), loop_factory=loop_factory)
         elif config.transport == "http":
             _run_http_server()
         else:
@@ -22,8 +22,9 @@ from pathlib import Path
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import Connection, Engine, create_engine, event, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from config import ServerConfig, reset_config
 from database.author_repository import (
@@ -35,7 +36,11 @@ from database.patron_repository import (
     PatronCreateSchema,
     PatronRepository,
 )
+from database.schema import Author as AuthorDB
 from database.schema import Base
+from database.schema import Book as BookDB
+from tools.book_insights import clear_insight_cache
+from tools.catalog_maintenance import clear_result_cache
 
 # === Pytest Configuration ===
 
@@ -55,7 +60,9 @@ def test_db_path(tmp_path: Path) -> Generator[Path, None, None]:
     """Provide a temporary database path for each test.
 
     MCP servers need persistent storage, but tests should be isolated.
-    This fixture ensures each test gets its own database file.
+    This fixture ensures each test gets its own database file. tmp_path is
+    unique per test AND per pytest-xdist worker, so `pytest -n auto` needs
+    no worker-specific database naming.
     """
     db_path = tmp_path / "test_library.db"
     yield db_path
@@ -71,42 +78,97 @@ def test_database_url(test_db_path: Path) -> str:
     return f"sqlite:///{test_db_path}"
 
 
-@pytest.fixture
-def test_db_session(test_database_url: str) -> Generator[Session, None, None]:
-    """Provide a SQLAlchemy session for database tests.
+@pytest.fixture(scope="session")
+def test_engine() -> Generator[Engine, None, None]:
+    """One in-memory database per test process, with the schema built once.
 
-    This fixture demonstrates how MCP servers handle database connections
-    in a test environment.
+    StaticPool pins the single connection that owns the in-memory
+    database; every test borrows it and undoes its writes afterwards (see
+    test_db_session), so DDL runs once per xdist worker instead of per test.
     """
-    # Create engine with test-specific settings
     engine = create_engine(
-        test_database_url,
+        "sqlite://",
         echo=False,  # Set to True for SQL debugging
+        poolclass=StaticPool,
         connect_args={"check_same_thread": False},  # SQLite specific
     )
 
-    # Create all tables
+    # pysqlite issues its own BEGINs and skips them around SAVEPOINT, which
+    # breaks nested transactions. Hand transaction control to SQLAlchemy.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
 
-    # Create session factory
-    session_local = sessionmaker(
-        autocommit=False,
+
+@pytest.fixture
+def db_connection(test_engine: Engine) -> Generator[Connection, None, None]:
+    """The connection a test's session runs on, inside a rolled-back transaction.
+
+    Test packages whose every test starts from the same seed override this
+    to hand out a SAVEPOINT on a connection seeded once per module (see
+    tests/tools/conftest.py), so the seed isn't re-inserted for each test.
+    """
+    connection = test_engine.connect()
+    outer = connection.begin()
+    try:
+        yield connection
+    finally:
+        outer.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def test_db_session(db_connection: Connection) -> Generator[Session, None, None]:
+    """Provide a SQLAlchemy session for database tests.
+
+    The session joins the transaction db_connection rolls back after the
+    test. Its own commit()/rollback() calls (which the tools make) only
+    release or roll back SAVEPOINTs inside it, so each test still sees an
+    empty database without rebuilding any tables.
+    """
+    # expire_on_commit=False matches the server's DatabaseManager and keeps
+    # fixture-seeded objects loaded after their commit, so reading e.g.
+    # `patron.id` in a test emits no extra SELECT.
+    session = Session(
+        bind=db_connection,
         autoflush=False,
-        bind=engine,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
 
-    # Create session
-    session = session_local()
-
     try:
         yield session
-        session.commit()
-    except Exception:
-        session.rollback()
-        raise
     finally:
         session.close()
-        engine.dispose()
+
+
+# The one author every seeded-library fixture hangs its books on.
+DEFAULT_AUTHOR_ID = "author_test001"
+DEFAULT_AUTHOR_ROW = {
+    "id": DEFAULT_AUTHOR_ID,
+    "name": "Test Author",
+    "birth_date": date(1970, 1, 1),
+}
+
+
+@pytest.fixture
+def default_author(test_db_session: Session) -> AuthorDB:
+    """Insert the shared `author_test001` row the library fixtures build on.
+
+    Seeded-library fixtures (tests/tools, tests/modern) all need the same
+    author; defining it once keeps those seeds from drifting apart.
+    """
+    author = AuthorDB(**DEFAULT_AUTHOR_ROW)
+    test_db_session.add(author)
+    return author
 
 
 # === Configuration Fixtures ===
@@ -239,16 +301,9 @@ def test_env(clean_env) -> dict[str, str]:
 # === Async Support Fixtures ===
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Provide an event loop for async tests.
-
-    MCP servers are often async, especially when handling
-    multiple concurrent operations or subscriptions.
-    """
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+# pytest-asyncio (asyncio_mode = "auto") gives every test its own event
+# loop. A session-scoped loop fixture would be state shared across tests,
+# which is exactly what must not leak between pytest-xdist workers' tests.
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -389,36 +444,39 @@ def sample_book(test_db_session):
 
 @pytest.fixture
 def sample_books(test_db_session):
-    """Create multiple sample books for testing."""
-    author_repo = AuthorRepository(test_db_session)
-    book_repo = BookRepository(test_db_session)
+    """Create multiple sample books for testing.
+
+    Rows go in as one multi-row INSERT per table rather than a repository
+    create() (validate, INSERT, flush) per row.
+    """
+    authors = [
+        {
+            "id": f"author_sample_{i}",
+            "name": f"Author {i}",
+            "birth_date": date(1970 + i, 1, 1),
+            "nationality": "American",
+            "biography": f"Biography {i}",
+        }
+        for i in range(3)
+    ]
+    test_db_session.execute(insert(AuthorDB), authors)
 
-    # Create several authors
-    authors = []
-    for i in range(3):
-        author_data = AuthorCreateSchema(
-            name=f"Author {i}",
-            birth_date=date(1970 + i, 1, 1),
-            nationality="American",
-            biography=f"Biography {i}",
-        )
-        author = author_repo.create(author_data)
-        authors.append(author)
-
-    # Create books
-    books = []
     genres = ["Fiction", "Science Fiction", "Mystery"]
-    for i in range(10):
-        book_data = BookCreateSchema(
-            isbn=f"978123456789{i}",
-            title=f"Book {i}",
-            author_id=authors[i % 3].id,
-            genre=genres[i % 3],
-            publication_year=2020 + (i % 4),
-            total_copies=3,
-        )
-        book = book_repo.create(book_data)
-        books.append(book)
+    books = test_db_session.scalars(
+        insert(BookDB).returning(BookDB),
+        [
+            {
+                "isbn": f"978123456789{i}",
+                "title": f"Book {i}",
+                "author_id": authors[i % 3]["id"],
+                "genre": genres[i % 3],
+                "publication_year": 2020 + (i % 4),
+                "total_copies": 3,
+                "available_copies": 3,
+            }
+            for i in range(10)
+        ],
+    ).all()
 
     test_db_session.commit()
     return books
@@ -476,6 +534,10 @@ def cleanup_after_test():
     # Reset global configuration
     reset_config()
 
+    # Memoized sampling and maintenance results must not leak into the next test
+    clear_insight_cache()
+    clear_result_cache()
+
     # Clear any test-specific environment variables
     for key in list(os.environ.keys()):
         if key.startswith(("TEST_", "VIRTUAL_LIBRARY_TEST_")):
@@ -30,7 +30,6 @@ import pytest
 from fastmcp import Context
 from mcp.types import ToolAnnotations
 
-from database.schema import Author as AuthorDB
 from database.schema import Book as BookDB
 from database.schema import Patron as PatronDB
 from modern.context import ModernContext
@@ -76,7 +75,7 @@ _PLAIN_SESSION_PATCHES = [
 
 
 @pytest.fixture
-def library(test_db_session, monkeypatch):
+def library(test_db_session, default_author, monkeypatch):
     """A small seeded library wired into every handler module.
 
     - author_test001 with one available book (Fiction) and one unavailable
@@ -94,9 +93,6 @@ def library(test_db_session, monkeypatch):
     for target in _PLAIN_SESSION_PATCHES:
         monkeypatch.setattr(target, lambda: test_db_session)
 
-    test_db_session.add(
-        AuthorDB(id="author_test001", name="Test Author", birth_date=date(1970, 1, 1))
-    )
     test_db_session.add_all(
         [
             BookDB(
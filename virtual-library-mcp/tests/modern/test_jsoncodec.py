@@ -0,0 +1,98 @@
+"""
+Tests for modern/jsoncodec.py — the wire JSON helpers shared by the
+stdio and Streamable HTTP transports.
+
+Whichever backend is active (orjson from the ``speed`` extra, or the
+stdlib), the bytes on the wire must be the same: compact, UTF-8, literal
+non-ASCII, never a raw newline.
+"""
+
+import enum
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import pytest
+
+from modern import jsoncodec
+
+
+def test_dumps_is_compact_utf8_without_newlines():
+    message = {"jsonrpc": "2.0", "id": 1, "result": {"text": "Café\nnoir", "n": [1, 2]}}
+    line = jsoncodec.dumps(message)
+    assert line == '{"jsonrpc":"2.0","id":1,"result":{"text":"Café\\nnoir","n":[1,2]}}'
+    assert "\n" not in line
+    assert jsoncodec.dumps_bytes(message) == line.encode("utf-8")
+
+
+def test_round_trip_matches_stdlib():
+    message = {"id": "req-1", "params": {"_meta": {"k": None}, "flag": True, "x": 1.5}}
+    assert jsoncodec.loads(jsoncodec.dumps(message)) == message
+    assert jsoncodec.loads(jsoncodec.dumps_bytes(message)) == json.loads(json.dumps(message))
+
+
+def test_ints_beyond_64_bits_still_encode():
+    assert jsoncodec.loads(jsoncodec.dumps({"big": 2**70})) == {"big": 2**70}
+
+
+@pytest.mark.parametrize("bad", ["{not json", b"\xff\xfe", ""])
+def test_malformed_input_raises_value_error(bad):
+    # Callers catch ValueError for -32700; each backend words it differently
+    with pytest.raises(ValueError):  # noqa: PT011
+        jsoncodec.loads(bad)
+
+
+def test_wire_response_renders_through_codec():
+    response = jsoncodec.WireJSONResponse({"msg": "naïve"}, status_code=400)
+    assert response.status_code == 400
+    assert response.body == '{"msg":"naïve"}'.encode()
+    assert response.headers["content-type"] == "application/json"
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+@dataclass
+class _Point:
+    x: int
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encode(request):
+    """dumps_bytes of each backend, so both are held to one contract."""
+    if request.param == "stdlib":
+        return jsoncodec._stdlib_dumps_bytes
+    if not jsoncodec.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    return jsoncodec.dumps_bytes
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        ({"text": "Café", "n": [1, 2.5, None, True]}, '{"text":"Café","n":[1,2.5,null,true]}'),
+        ({1: "a"}, '{"1":"a"}'),
+        ((1, 2), "[1,2]"),
+        ({"big": 2**70}, '{"big":1180591620717411303424}'),
+        (uuid.UUID(int=1), '"00000000-0000-0000-0000-000000000001"'),
+        ({"color": _Color.RED}, '{"color":"red"}'),
+    ],
+)
+def test_backends_encode_identically(encode, payload, expected):
+    assert encode(payload) == expected.encode("utf-8")
+
+
+@pytest.mark.parametrize("payload", [datetime(2026, 1, 1, tzinfo=UTC), _Point(1)])
+def test_backends_reject_non_json_types(encode, payload):
+    with pytest.raises(TypeError):
+        encode({"value": payload})
+
+
+def test_non_finite_floats_never_reach_the_wire(encode):
+    try:
+        encoded = encode({"x": float("nan"), "y": float("inf")})
+    except ValueError:
+        return  # the stdlib refuses
+    assert encoded == b'{"x":null,"y":null}'  # orjson writes null
@@ -18,6 +18,7 @@ from database import (
     Book,
     CheckoutRecord,
     CirculationStatusEnum,
+    DatabaseManager,
     Patron,
     PatronStatusEnum,
     get_db_manager,
@@ -58,9 +59,84 @@ class TestDatabaseSchema:
             "checkout_records",
             "return_records",
             "reservation_records",
+            "popular_books",
         }
 
-        assert set(tables) == expected_tables
+        # books_fts is the FTS5 full-text index; SQLite backs it with
+        # books_fts_* shadow tables
+        assert "books_fts" in tables
+        assert {t for t in tables if not t.startswith("books_fts")} == expected_tables
+
+    def test_overdue_loan_lookup_uses_status_due_date_index(self, session):
+        """Active loans past their due date are found with one index range scan."""
+        from sqlalchemy import text
+
+        plan = session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM checkout_records "
+                "WHERE status = 'ACTIVE' AND due_date < '2024-01-01'"
+            )
+        ).all()
+
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_checkout_status_due_date (status=? AND due_date<?)" in details
+
+    def test_search_index_triggers_find_rows_by_rowid(self, session):
+        """The FTS sync triggers look a book's index row up by rowid, not a full scan."""
+        import re
+
+        from sqlalchemy import text
+
+        trigger_sql = session.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'books_fts_au'")
+        ).scalar_one()
+        delete = re.search(r"DELETE FROM books_fts\s.*?;", trigger_sql, re.DOTALL).group(0)
+        plan = session.execute(
+            text("EXPLAIN QUERY PLAN " + delete.rstrip(";").replace("old.isbn", "'x'"))
+        ).all()
+
+        details = [row[-1] for row in plan]
+        assert "SCAN books_fts VIRTUAL TABLE INDEX 0:=" in details  # rowid equality
+        assert any(d.startswith("SEARCH books_fts_keys") for d in details)
+
+    def test_search_index_follows_updates_and_deletes(self, session):
+        """Retitling or deleting a book updates its full-text entry and key."""
+        from sqlalchemy import text
+
+        session.add(Author(id="author_fts001", name="Index Author"))
+        for isbn, title in [("9780000000001", "Alpha Saga"), ("9780000000002", "Beta Saga")]:
+            session.add(
+                Book(
+                    isbn=isbn,
+                    title=title,
+                    author_id="author_fts001",
+                    genre="Fiction",
+                    publication_year=2000,
+                    total_copies=1,
+                    available_copies=1,
+                )
+            )
+        session.commit()
+
+        def matches(term):
+            return (
+                session.execute(
+                    text("SELECT isbn FROM books_fts WHERE books_fts MATCH :term ORDER BY isbn"),
+                    {"term": term},
+                )
+                .scalars()
+                .all()
+            )
+
+        session.get(Book, "9780000000001").title = "Gamma Saga"
+        session.delete(session.get(Book, "9780000000002"))
+        session.commit()
+
+        assert matches("saga") == ["9780000000001"]
+        assert matches("alpha") == []
+        assert matches("gamma") == ["9780000000001"]
+        keys = session.execute(text("SELECT isbn FROM books_fts_keys")).scalars().all()
+        assert keys == ["9780000000001"]
 
     def test_author_creation(self, session):
         """Test creating an author."""
@@ -267,6 +343,21 @@ class TestSessionManagement:
             assert author is not None
             assert author.name == "Multi Session"
 
+    def test_file_database_uses_pooled_wal_connections(self, tmp_path):
+        """File-backed SQLite gets a real pool and WAL/cache pragmas."""
+        from sqlalchemy import text
+        from sqlalchemy.pool import QueuePool
+
+        manager = DatabaseManager(f"sqlite:///{tmp_path / 'pooled.db'}")
+        try:
+            assert isinstance(manager.engine.pool, QueuePool)
+            with manager.engine.connect() as conn:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+                assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        finally:
+            manager.close()
+
 
 class TestEnumHandling:
     """Test that enums are properly handled in the database."""
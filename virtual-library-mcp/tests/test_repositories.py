@@ -5,10 +5,12 @@ These tests demonstrate how the repository pattern integrates with
 the MCP server architecture.
 """
 
+import base64
+import json
 from datetime import date, timedelta
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text, update
 from sqlalchemy.orm import Session, sessionmaker
 
 from database import (
@@ -16,6 +18,7 @@ from database import (
     Base,
     BookRepository,
     CirculationRepository,
+    InvalidCursorError,
     PaginationParams,
     PatronRepository,
 )
@@ -26,6 +29,7 @@ from database.author_repository import (
 from database.book_repository import (
     BookCreateSchema,
     BookSearchParams,
+    BookSortOptions,
     BookUpdateSchema,
 )
 from database.circulation_repository import (
@@ -37,6 +41,7 @@ from database.patron_repository import (
     PatronCreateSchema,
     PatronSearchParams,
 )
+from database.schema import Book as BookDB
 from database.schema import CheckoutRecord as CheckoutDB
 
 
@@ -206,6 +211,218 @@ def test_pagination(repositories: dict[str, object]) -> None:
     assert page3.has_previous is True
 
 
+def test_book_search_cursor_pagination(repositories: dict[str, object]) -> None:
+    """Keyset cursors walk the same rows, in the same order, as OFFSET pages."""
+    author = repositories["author"].create(AuthorCreateSchema(name="Cursor Author"))
+    book_repo = repositories["book"]
+    for i, year in enumerate([2001, 1999, 2001, 2010, 1999, 2005, 2001]):
+        book_repo.create(
+            BookCreateSchema(
+                isbn=f"978000000000{i}",
+                title=f"Book {i}",
+                author_id=author.id,
+                genre="Fiction",
+                publication_year=year,
+                total_copies=1,
+            )
+        )
+
+    params = BookSearchParams(genre="Fiction")
+    for sort_by, sort_desc in [
+        (BookSortOptions.TITLE, False),
+        (BookSortOptions.PUBLICATION_YEAR, True),
+        (BookSortOptions.CREATED_AT, False),
+    ]:
+        expected = book_repo.search(
+            params, PaginationParams(page_size=100), sort_by=sort_by, sort_desc=sort_desc
+        )
+        walked, cursor = [], None
+        while True:
+            page = book_repo.search(
+                params,
+                PaginationParams(page_size=3),
+                sort_by=sort_by,
+                sort_desc=sort_desc,
+                cursor=cursor,
+            )
+            walked.extend(book.isbn for book in page.items)
+            cursor = page.next_cursor
+            assert (cursor is not None) == page.has_next
+            if cursor is None:
+                break
+        assert walked == [book.isbn for book in expected.items]
+
+    first = book_repo.search(params, PaginationParams(page_size=3))
+    with pytest.raises(InvalidCursorError, match="different sort order"):
+        book_repo.search(
+            params, PaginationParams(page_size=3), sort_desc=True, cursor=first.next_cursor
+        )
+    with pytest.raises(InvalidCursorError, match="Malformed"):
+        book_repo.search(params, PaginationParams(page_size=3), cursor="not-a-cursor")
+    for payload in (
+        {"v": "a", "i": "x"},
+        ["title", False, "a", "x"],
+        {"s": "title", "d": False},
+        {"s": "title", "d": False, "v": {"a": 1}, "i": "x"},
+        {"s": "title", "d": False, "v": ["a"], "i": "x"},
+    ):
+        forged = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        with pytest.raises(InvalidCursorError, match="Malformed"):
+            book_repo.search(params, PaginationParams(page_size=3), cursor=forged)
+
+
+def test_book_search_cursor_pages_through_null_sort_values(
+    repositories: dict[str, object], test_session: Session
+) -> None:
+    """Rows whose sort column is NULL are neither dropped nor a dead end."""
+    author = repositories["author"].create(AuthorCreateSchema(name="Null Sort Author"))
+    book_repo = repositories["book"]
+    for i in range(6):
+        book_repo.create(
+            BookCreateSchema(
+                isbn=f"978000000001{i}",
+                title=f"Book {i}",
+                author_id=author.id,
+                genre="Fiction",
+                publication_year=2000,
+                total_copies=1,
+            )
+        )
+    test_session.execute(
+        update(BookDB)
+        .where(BookDB.isbn.in_(["9780000000011", "9780000000014"]))
+        .values(updated_at=None)
+    )
+    test_session.commit()
+
+    params = BookSearchParams(genre="Fiction")
+    for sort_desc in (False, True):
+        expected = book_repo.search(
+            params,
+            PaginationParams(page_size=100),
+            sort_by=BookSortOptions.UPDATED_AT,
+            sort_desc=sort_desc,
+        )
+        assert len(expected.items) == 6
+        walked, cursor = [], None
+        while True:
+            page = book_repo.search(
+                params,
+                PaginationParams(page_size=1),
+                sort_by=BookSortOptions.UPDATED_AT,
+                sort_desc=sort_desc,
+                cursor=cursor,
+            )
+            walked.extend(book.isbn for book in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert walked == [book.isbn for book in expected.items]
+
+
+def test_book_search_count_skips_unneeded_work(
+    test_session: Session, repositories: dict[str, object]
+) -> None:
+    """The COUNT joins authors only for author filters and never sorts."""
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(test_session.bind, "before_cursor_execute", capture)
+    try:
+        book_repo = repositories["book"]
+        book_repo.search(BookSearchParams(genre="Fiction"), sort_by=BookSortOptions.AUTHOR)
+        book_repo.search(BookSearchParams(author_name="lee"))
+    finally:
+        event.remove(test_session.bind, "before_cursor_execute", capture)
+
+    genre_count, _, author_count, _ = statements
+    assert "count(" in genre_count
+    assert "authors" not in genre_count
+    assert "ORDER BY" not in genre_count
+    assert "JOIN authors" in author_count
+    assert "ORDER BY" not in author_count
+
+
+def test_book_search_query_uses_full_text_index(
+    test_session: Session, repositories: dict[str, object]
+) -> None:
+    """query matches title/description words via books_fts, kept in sync by triggers."""
+    author = repositories["author"].create(AuthorCreateSchema(name="Scott Fitzgerald"))
+    book_repo = repositories["book"]
+    book_repo.create(
+        BookCreateSchema(
+            isbn="9780134685479",
+            title="The Great Gatsby",
+            author_id=author.id,
+            genre="Fiction",
+            publication_year=1925,
+            total_copies=1,
+            available_copies=1,
+            description="A portrait of the Jazz Age in American society.",
+        )
+    )
+
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(test_session.bind, "before_cursor_execute", capture)
+    try:
+        assert book_repo.search(BookSearchParams(query="gats")).total == 1
+    finally:
+        event.remove(test_session.bind, "before_cursor_execute", capture)
+    assert any("books_fts MATCH" in statement for statement in statements)
+
+    def total(query: str) -> int:
+        return book_repo.search(BookSearchParams(query=query)).total
+
+    assert total("american jazz") == 1
+    assert total('"jazz age*') == 1  # stray FTS5 syntax in user input is inert
+    assert total("american mockingbird") == 0
+    assert total("fitzgerald") == 1  # author name still matches
+    assert total("685479") == 1  # ...and partial ISBNs
+    assert total("!!!") == 0  # no words: falls back to substring matching
+
+    book_repo.update("9780134685479", BookUpdateSchema(title="Trimalchio"))
+    assert total("gatsby") == 0
+    assert total("trimalchio") == 1
+
+    test_session.delete(test_session.get(BookDB, "9780134685479"))
+    test_session.commit()
+    assert total("trimalchio") == 0
+
+
+def test_book_genre_filter_is_case_insensitive(
+    test_session: Session, repositories: dict[str, object]
+) -> None:
+    """Genre filters match any casing and seek the lower(genre) index."""
+    author = repositories["author"].create(AuthorCreateSchema(name="Roald Dahl"))
+    book_repo = repositories["book"]
+    book_repo.create(
+        BookCreateSchema(
+            isbn="9780142410318",
+            title="Matilda",
+            author_id=author.id,
+            genre="Children's",
+            publication_year=1988,
+            total_copies=1,
+            available_copies=1,
+        )
+    )
+
+    # str.title() would have turned this into "Children'S"
+    assert book_repo.search(BookSearchParams(genre="children's")).total == 1
+    assert book_repo.get_by_genre(" CHILDREN'S ").total == 1
+
+    plan = test_session.execute(
+        text("EXPLAIN QUERY PLAN SELECT isbn FROM books WHERE lower(genre) = 'fiction'")
+    ).all()
+    assert "idx_book_genre_lower" in plan[0][-1]
+
+
 def test_book_update(repositories: dict[str, object]) -> None:
     """Test book update functionality."""
     author_repo = repositories["author"]
@@ -323,6 +540,18 @@ def test_circulation_edge_cases(repositories: dict[str, object]) -> None:
     assert reservation.queue_position == 1
     assert reservation.status == "pending"
 
+    # Reservation plus queue info in one transaction
+    patron3 = repositories["patron"].create(
+        PatronCreateSchema(name="Patron Three", email="patron3@example.com")
+    )
+    second, queue_info = circulation_repo.create_reservation_with_queue(
+        ReservationCreateSchema(patron_id=patron3.id, book_isbn=book.isbn)
+    )
+    assert second.queue_position == 2
+    assert queue_info.total_reservations == 2
+    assert queue_info.pending_reservations == 2
+    assert queue_info.estimated_wait_days == 28
+
 
 def test_return_with_fines(repositories: dict[str, object]) -> None:
     """Test return process with fine calculation."""
@@ -432,3 +661,29 @@ def test_sorting_and_filtering(repositories: dict[str, object]) -> None:
     # Test get nationalities
     nationalities = author_repo.get_nationalities()
     assert set(nationalities) == {"American", "British"}
+
+
+def test_get_by_isbn_with_author_name(repositories: dict[str, object]) -> None:
+    """Book and author name come back from a single joined lookup."""
+    author_repo = repositories["author"]
+    book_repo = repositories["book"]
+
+    author = author_repo.create(AuthorCreateSchema(name="Harper Lee"))
+    book_repo.create(
+        BookCreateSchema(
+            isbn="9780061120084",
+            title="To Kill a Mockingbird",
+            author_id=author.id,
+            genre="Fiction",
+            publication_year=1960,
+            total_copies=2,
+        )
+    )
+
+    loaded = book_repo.get_by_isbn_with_author_name("978-0-06-112008-4")
+    assert loaded is not None
+    book, author_name = loaded
+    assert book.title == "To Kill a Mockingbird"
+    assert author_name == "Harper Lee"
+
+    assert book_repo.get_by_isbn_with_author_name("9780000000000") is None
@@ -4,29 +4,24 @@ Tool tests run through the FastMCP in-memory Client against the real
 server instance (server.mcp), so they exercise the actual protocol path:
 input schema validation, elicitation round-trips, structured content,
 and ToolError -> isError conversion. The only thing faked is the
-database session, which is pointed at a seeded per-test SQLite database.
+database session, which is pointed at the shared in-memory SQLite
+database. The library is seeded once per test module and every test runs
+inside a SAVEPOINT that is rolled back afterwards.
 """
 
+from collections.abc import Generator
 from contextlib import contextmanager
-from datetime import date, datetime, timedelta
+from datetime import datetime, timedelta
 
 import pytest
+from sqlalchemy import Connection, Engine, insert
 
-from database.schema import (
-    Author as AuthorDB,
-)
-from database.schema import (
-    Book as BookDB,
-)
-from database.schema import (
-    CheckoutRecord as CheckoutDB,
-)
-from database.schema import (
-    CirculationStatusEnum,
-)
-from database.schema import (
-    Patron as PatronDB,
-)
+from database.schema import Author as AuthorDB
+from database.schema import Book as BookDB
+from database.schema import CheckoutRecord as CheckoutDB
+from database.schema import CirculationStatusEnum, PatronStatusEnum
+from database.schema import Patron as PatronDB
+from tests.conftest import DEFAULT_AUTHOR_ID, DEFAULT_AUTHOR_ROW
 
 # Every tools module imports its session factory into its own namespace,
 # so each must be patched where it is *used*, not where it is defined.
@@ -41,6 +36,131 @@ _SESSION_FACTORY_PATCHES = [
     "resources.stats.session_scope",
 ]
 
+# The clock is read once, when this module is imported, instead of inside
+# the fixture: every test sees byte-identical rows, so the seed is built
+# once per module and shared. The tools themselves still read the real
+# clock (fines, membership expiry), so the seed stays anchored to "now"
+# rather than a fixed calendar date — "overdue by 4 days" must stay true.
+_FROZEN_NOW = datetime.now()
+_FROZEN_TODAY = _FROZEN_NOW.date()
+
+
+def _seed_library(connection: Connection) -> None:
+    """Insert the tool-test library: one multi-row INSERT per table."""
+    today = _FROZEN_TODAY
+    connection.execute(insert(AuthorDB), [DEFAULT_AUTHOR_ROW])
+    connection.execute(
+        insert(BookDB),
+        [
+            {
+                "isbn": "9780134685991",
+                "title": "The Available Book",
+                "author_id": DEFAULT_AUTHOR_ID,
+                "genre": "Fiction",
+                "publication_year": 2020,
+                "available_copies": 3,
+                "total_copies": 3,
+                "description": "A book with copies on the shelf.",
+            },
+            {
+                "isbn": "9780134685007",
+                "title": "The Popular Book",
+                "author_id": DEFAULT_AUTHOR_ID,
+                "genre": "Science Fiction",
+                "publication_year": 2021,
+                "available_copies": 0,
+                "total_copies": 2,
+                "description": "A book that is always checked out.",
+            },
+        ],
+    )
+    connection.execute(
+        insert(PatronDB),
+        [
+            {
+                "id": "patron_clean001",
+                "name": "Clean Reader",
+                "email": "clean@example.com",
+                "membership_date": today - timedelta(days=400),
+                "expiration_date": today + timedelta(days=200),
+                "status": PatronStatusEnum.ACTIVE,
+                "borrowing_limit": 5,
+                "current_checkouts": 1,
+                "total_checkouts": 12,
+                "outstanding_fines": 0.0,
+            },
+            {
+                "id": "patron_fines001",
+                "name": "Fined Reader",
+                "email": "fined@example.com",
+                "membership_date": today - timedelta(days=300),
+                "expiration_date": today + timedelta(days=100),
+                "status": PatronStatusEnum.ACTIVE,
+                "borrowing_limit": 5,
+                "current_checkouts": 0,
+                "total_checkouts": 30,
+                "outstanding_fines": 4.50,
+            },
+            {
+                "id": "patron_lapsed01",
+                "name": "Lapsed Reader",
+                "email": "lapsed@example.com",
+                "membership_date": today - timedelta(days=900),
+                "expiration_date": today - timedelta(days=90),
+                "status": PatronStatusEnum.EXPIRED,
+                "borrowing_limit": 5,
+                "current_checkouts": 0,
+                "total_checkouts": 4,
+                "outstanding_fines": 0.0,
+            },
+        ],
+    )
+    connection.execute(
+        insert(CheckoutDB),
+        [
+            {
+                "id": "checkout_active01",
+                "patron_id": "patron_clean001",
+                "book_isbn": "9780134685007",
+                "checkout_date": _FROZEN_NOW - timedelta(days=18),
+                "due_date": today - timedelta(days=4),
+                "status": CirculationStatusEnum.OVERDUE,
+            }
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def seeded_library(test_engine: Engine) -> Generator[Connection, None, None]:
+    """A connection holding the seeded library, built once per test module.
+
+    The seed sits in an open transaction that is rolled back when the
+    module is done; tests see it through db_connection below.
+    """
+    connection = test_engine.connect()
+    outer = connection.begin()
+    _seed_library(connection)
+    try:
+        yield connection
+    finally:
+        outer.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def db_connection(seeded_library: Connection) -> Generator[Connection, None, None]:
+    """Run each test inside a SAVEPOINT over the module's seed.
+
+    Rolling the SAVEPOINT back undoes whatever the test (or the tool under
+    test) wrote, leaving the seed intact for the next test in the module.
+    """
+    savepoint = seeded_library.begin_nested()
+    try:
+        yield seeded_library
+    finally:
+        if savepoint.is_active:
+            savepoint.rollback()
+
 
 @pytest.fixture
 def library(test_db_session, monkeypatch):
@@ -61,81 +181,4 @@ def library(test_db_session, monkeypatch):
     for target in _SESSION_FACTORY_PATCHES:
         monkeypatch.setattr(target, _test_session)
 
-    author = AuthorDB(id="author_test001", name="Test Author", birth_date=date(1970, 1, 1))
-    test_db_session.add(author)
-
-    available_book = BookDB(
-        isbn="9780134685991",
-        title="The Available Book",
-        author_id="author_test001",
-        genre="Fiction",
-        publication_year=2020,
-        available_copies=3,
-        total_copies=3,
-        description="A book with copies on the shelf.",
-    )
-    unavailable_book = BookDB(
-        isbn="9780134685007",
-        title="The Popular Book",
-        author_id="author_test001",
-        genre="Science Fiction",
-        publication_year=2021,
-        available_copies=0,
-        total_copies=2,
-        description="A book that is always checked out.",
-    )
-    test_db_session.add_all([available_book, unavailable_book])
-
-    today = date.today()
-    patrons = [
-        PatronDB(
-            id="patron_clean001",
-            name="Clean Reader",
-            email="clean@example.com",
-            membership_date=today - timedelta(days=400),
-            expiration_date=today + timedelta(days=200),
-            status="active",
-            borrowing_limit=5,
-            current_checkouts=1,
-            total_checkouts=12,
-            outstanding_fines=0.0,
-        ),
-        PatronDB(
-            id="patron_fines001",
-            name="Fined Reader",
-            email="fined@example.com",
-            membership_date=today - timedelta(days=300),
-            expiration_date=today + timedelta(days=100),
-            status="active",
-            borrowing_limit=5,
-            current_checkouts=0,
-            total_checkouts=30,
-            outstanding_fines=4.50,
-        ),
-        PatronDB(
-            id="patron_lapsed01",
-            name="Lapsed Reader",
-            email="lapsed@example.com",
-            membership_date=today - timedelta(days=900),
-            expiration_date=today - timedelta(days=90),
-            status="expired",
-            borrowing_limit=5,
-            current_checkouts=0,
-            total_checkouts=4,
-            outstanding_fines=0.0,
-        ),
-    ]
-    test_db_session.add_all(patrons)
-
-    checkout = CheckoutDB(
-        id="checkout_active01",
-        patron_id="patron_clean001",
-        book_isbn="9780134685007",
-        checkout_date=datetime.now() - timedelta(days=18),
-        due_date=today - timedelta(days=4),
-        status=CirculationStatusEnum.OVERDUE,
-    )
-    test_db_session.add(checkout)
-    test_db_session.commit()
-
     return test_db_session
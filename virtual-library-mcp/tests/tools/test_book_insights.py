@@ -5,9 +5,12 @@ client whose LLM answers the server's request) or omits it (simulating a
 client without the sampling capability, which must trigger fallback).
 """
 
+import asyncio
+
 import pytest
 from fastmcp import Client
 from fastmcp.exceptions import ToolError
+from mcp.server.session import ServerSession
 
 import server
 from tools.book_insights import search_library_catalog
@@ -37,6 +40,32 @@ async def plain_client(library):
         yield c
 
 
+class TestInsightsSchema:
+    """The schema is derived once, at registration, from the signature."""
+
+    async def test_input_schema_is_the_validation_contract(self, plain_client):
+        tools = {t.name: t for t in await plain_client.list_tools()}
+        schema = tools["generate_book_insights"].inputSchema
+        assert schema["required"] == ["isbn"]
+        assert schema["properties"]["isbn"]["pattern"] == r"^[0-9]{13}$"
+        insight_type = schema["properties"]["insight_type"]
+        assert insight_type["default"] == "summary"
+        assert insight_type["enum"] == [
+            "summary",
+            "themes",
+            "discussion_questions",
+            "similar_books",
+            "all",
+        ]
+
+    async def test_unknown_insight_type_is_rejected_by_schema(self, plain_client):
+        with pytest.raises(ToolError):
+            await plain_client.call_tool(
+                "generate_book_insights",
+                {"isbn": "9780134685991", "insight_type": "horoscope"},
+            )
+
+
 class TestSamplingPath:
     async def test_summary_uses_client_llm(self, sampling_client, sampling_calls):
         result = await sampling_client.call_tool(
@@ -48,6 +77,17 @@ class TestSamplingPath:
         assert "thoughtful AI-generated analysis" in text
         assert len(sampling_calls) == 1
 
+    async def test_prompt_is_filled_from_the_catalog_record(self, sampling_client, sampling_calls):
+        await sampling_client.call_tool(
+            "generate_book_insights",
+            {"isbn": "9780134685991", "insight_type": "summary"},
+        )
+        prompt = sampling_calls[0].messages[0].content.text
+        assert "Title: The Available Book" in prompt
+        assert "Author: Test Author" in prompt
+        assert "Published: 2020" in prompt
+        assert "Current description: A book with copies on the shelf." in prompt
+
     async def test_model_preferences_are_hints(self, sampling_client, sampling_calls):
         await sampling_client.call_tool(
             "generate_book_insights",
@@ -57,6 +97,70 @@ class TestSamplingPath:
         assert prefs is not None
         assert prefs.hints[0].name == "claude-opus-4-8"
 
+    async def test_repeat_request_is_served_from_cache(self, sampling_client, sampling_calls):
+        args = {"isbn": "9780134685991", "insight_type": "summary"}
+        first = await sampling_client.call_tool("generate_book_insights", args)
+        second = await sampling_client.call_tool("generate_book_insights", args)
+        assert second.content[0].text == first.content[0].text
+        assert len(sampling_calls) == 1
+
+        await sampling_client.call_tool(
+            "generate_book_insights", {"isbn": "9780134685991", "insight_type": "themes"}
+        )
+        assert len(sampling_calls) == 2
+
+    async def test_concurrent_identical_requests_share_one_sampling_call(
+        self, library, monkeypatch
+    ):
+        calls = []
+        started = asyncio.Event()
+        joined = asyncio.Event()
+        release = asyncio.Event()
+
+        class _InflightWatch(dict):
+            """Signals when a second caller finds the generation in flight."""
+
+            def get(self, key, default=None):
+                found = super().get(key, default)
+                if found is not None:
+                    joined.set()
+                return found
+
+        monkeypatch.setattr("tools.book_insights._inflight_insights", _InflightWatch())
+
+        async def slow_handler(messages, params, context):
+            calls.append(params)
+            started.set()
+            await release.wait()
+            return "One shared generation."
+
+        args = {"isbn": "9780134685991", "insight_type": "summary"}
+        async with Client(server.mcp, sampling_handler=slow_handler) as client:
+            first = asyncio.create_task(client.call_tool("generate_book_insights", args))
+            # Start the duplicate once the first is waiting on the LLM (the
+            # test shares one DB session, so the lookups must not overlap)
+            await started.wait()
+            second = asyncio.create_task(client.call_tool("generate_book_insights", args))
+            await asyncio.wait_for(joined.wait(), timeout=5)
+            release.set()
+            results = await asyncio.gather(first, second)
+
+        assert len(calls) == 1
+        assert all("One shared generation." in r.content[0].text for r in results)
+
+    async def test_all_generates_every_section_in_one_call(self, sampling_client, sampling_calls):
+        result = await sampling_client.call_tool(
+            "generate_book_insights",
+            {"isbn": "9780134685991", "insight_type": "all"},
+        )
+        text = result.content[0].text
+        assert text.count("**Book Information**") == 1
+        for heading in ("Summary", "Themes", "Discussion Questions"):
+            assert f"AI-Generated {heading}" in text
+        # No sampling.tools capability: similar_books falls back on its own
+        assert "Finding Similar Books" in text
+        assert len(sampling_calls) == 3
+
     async def test_unknown_isbn_is_tool_error(self, sampling_client):
         with pytest.raises(ToolError, match="not found"):
             await sampling_client.call_tool("generate_book_insights", {"isbn": "9990000000000"})
@@ -72,6 +176,37 @@ class TestFallbackPath:
         assert "Book Information" in text
         assert "The Available Book" in text
 
+    async def test_all_falls_back_section_by_section(self, plain_client):
+        result = await plain_client.call_tool(
+            "generate_book_insights",
+            {"isbn": "9780134685991", "insight_type": "all"},
+        )
+        text = result.content[0].text
+        assert text.count("**Book Information**") == 1
+        assert "A book with copies on the shelf." in text
+        assert "Genre-Typical Themes" in text
+        assert "human nature" in text  # the Fiction entry of the genre table
+        assert "Generic Discussion Questions" in text
+        assert "Finding Similar Books" in text
+
+    async def test_capability_is_checked_once_per_session(self, plain_client, monkeypatch):
+        checks = []
+        original = ServerSession.check_client_capability
+
+        def counting_check(self, capability):
+            checks.append(capability)
+            return original(self, capability)
+
+        monkeypatch.setattr(ServerSession, "check_client_capability", counting_check)
+        for insight_type in ("summary", "themes", "all"):
+            await plain_client.call_tool(
+                "generate_book_insights",
+                {"isbn": "9780134685991", "insight_type": insight_type},
+            )
+        # Without sampling support no request is even attempted, and the
+        # answer is remembered for the rest of the session.
+        assert len(checks) == 1
+
     async def test_each_insight_type_has_meaningful_fallback(self, plain_client):
         for insight_type in ("themes", "discussion_questions", "similar_books"):
             result = await plain_client.call_tool(
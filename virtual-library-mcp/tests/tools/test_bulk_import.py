@@ -6,13 +6,17 @@ never be able to point this tool at an arbitrary server path.
 
 import csv
 import json
+import threading
+from collections.abc import Iterator
 
 import pytest
 from fastmcp import Client
 from fastmcp.exceptions import ToolError
+from sqlalchemy import select
 
 import server
 import tools.bulk_import as bulk_import_module
+from database.schema import Author as AuthorDB
 from database.schema import Book as BookDB
 
 
@@ -115,6 +119,107 @@ class TestImportBehavior:
         assert data["successful_imports"] == 1
         assert data["failed_imports"] == 1
 
+    async def test_authors_are_matched_by_name_and_created_once(self, import_root, library):
+        rows = [
+            *SAMPLE_ROWS,  # two books by the same new author
+            {**SAMPLE_ROWS[0], "isbn": "9783333333333", "author_name": "Test Author"},
+        ]
+        _write_csv(import_root / "books.csv", rows)
+
+        async with Client(server.mcp) as client:
+            result = await client.call_tool(
+                "bulk_import_books", {"file_path": "books.csv", "batch_size": 2}
+            )
+
+        assert result.structured_content["successful_imports"] == 3
+        new_authors = library.scalars(select(AuthorDB).where(AuthorDB.name == "New Author")).all()
+        assert len(new_authors) == 1
+        assert library.get(BookDB, "9782222222222").author_id == new_authors[0].id
+        assert library.get(BookDB, "9783333333333").author_id == "author_test001"
+
+    async def test_duplicate_of_existing_book_fails_only_that_row(self, import_root, library):
+        rows = [{**SAMPLE_ROWS[0], "isbn": "9780134685991"}, SAMPLE_ROWS[1]]  # first is seeded
+        _write_csv(import_root / "books.csv", rows)
+
+        async with Client(server.mcp) as client:
+            result = await client.call_tool("bulk_import_books", {"file_path": "books.csv"})
+
+        data = result.structured_content
+        assert (data["successful_imports"], data["failed_imports"]) == (1, 1)
+        assert data["errors"] == ["Book 1: ISBN 9780134685991 already exists"]
+        assert library.get(BookDB, "9782222222222") is not None
+
+    async def test_skipped_row_leaves_no_orphaned_author(self, import_root, library):
+        rows = [{**SAMPLE_ROWS[0], "isbn": "9780134685991", "author_name": "Orphan Author"}]
+        _write_csv(import_root / "books.csv", rows)
+
+        async with Client(server.mcp) as client:
+            result = await client.call_tool("bulk_import_books", {"file_path": "books.csv"})
+
+        assert result.structured_content["failed_imports"] == 1
+        assert library.scalars(select(AuthorDB).where(AuthorDB.name == "Orphan Author")).all() == []
+
+    async def test_author_dropped_with_failed_row_is_recreated_later(self, import_root, library):
+        rows = [
+            {**SAMPLE_ROWS[0], "publication_year": 1200},  # CHECK failure, new author
+            SAMPLE_ROWS[1],  # same author, next batch
+        ]
+        _write_csv(import_root / "books.csv", rows)
+
+        async with Client(server.mcp) as client:
+            result = await client.call_tool(
+                "bulk_import_books", {"file_path": "books.csv", "batch_size": 1}
+            )
+
+        assert result.structured_content["successful_imports"] == 1
+        new_authors = library.scalars(select(AuthorDB).where(AuthorDB.name == "New Author")).all()
+        assert len(new_authors) == 1
+        assert library.get(BookDB, "9782222222222").author_id == new_authors[0].id
+
+    async def test_constraint_failure_fails_only_that_row(self, import_root, library):
+        rows = [{**SAMPLE_ROWS[0], "publication_year": 1200}, SAMPLE_ROWS[1], SAMPLE_ROWS[1]]
+        _write_csv(import_root / "books.csv", rows)
+
+        async with Client(server.mcp) as client:
+            result = await client.call_tool("bulk_import_books", {"file_path": "books.csv"})
+
+        data = result.structured_content
+        assert (data["successful_imports"], data["failed_imports"]) == (1, 2)
+        assert "check_publication_year_valid" in data["errors"][0]
+        assert data["errors"][1] == "Book 3: ISBN 9782222222222 already exists"
+
+    async def test_summary_keeps_first_errors_and_exact_count(self, import_root, library):
+        rows = [{**SAMPLE_ROWS[0], "isbn": f"97800000000{n:02d}", "title": ""} for n in range(25)]
+        _write_csv(import_root / "books.csv", rows)
+
+        async with Client(server.mcp) as client:
+            result = await client.call_tool(
+                "bulk_import_books", {"file_path": "books.csv", "batch_size": 10}
+            )
+
+        data = result.structured_content
+        assert data["failed_imports"] == 25
+        assert len(data["errors"]) == 10
+        assert data["errors"][0].startswith("Book 1: Validation error")
+        assert data["errors_truncated"] is True
+
+    async def test_database_work_runs_off_the_event_loop(self, import_root, library, monkeypatch):
+        _write_csv(import_root / "books.csv", SAMPLE_ROWS)
+        write_threads = []
+        write_batch = bulk_import_module._write_batch
+
+        def recording_write_batch(*args):
+            write_threads.append(threading.current_thread())
+            return write_batch(*args)
+
+        monkeypatch.setattr(bulk_import_module, "_write_batch", recording_write_batch)
+        async with Client(server.mcp) as client:
+            result = await client.call_tool("bulk_import_books", {"file_path": "books.csv"})
+
+        assert result.structured_content["successful_imports"] == 2
+        assert write_threads
+        assert threading.main_thread() not in write_threads
+
     async def test_progress_notifications_emitted(self, import_root, library):
         _write_csv(import_root / "books.csv", SAMPLE_ROWS)
         updates: list[tuple] = []
@@ -132,3 +237,127 @@ class TestImportBehavior:
         assert updates, "expected progress notifications during import"
         final = updates[-1]
         assert final[0] == final[1]  # progress == total at completion
+
+    async def test_progress_and_warnings_are_per_batch(self, import_root, library):
+        rows = [*SAMPLE_ROWS, {**SAMPLE_ROWS[0], "isbn": "", "title": "No ISBN"}]
+        _write_csv(import_root / "books.csv", rows)
+        updates: list[tuple] = []
+        warnings: list[str] = []
+
+        async def on_progress(progress, total, message):
+            updates.append((progress, total, message))
+
+        async def on_log(message):
+            if message.level == "warning":
+                warnings.append(message.data["msg"])
+
+        async with Client(server.mcp, log_handler=on_log) as client:
+            await client.call_tool(
+                "bulk_import_books",
+                {"file_path": "books.csv", "batch_size": 2},
+                progress_handler=on_progress,
+            )
+
+        # Two batches plus the completion report, not one per book
+        assert [u[0] for u in updates] == [2, 3, 3]
+        batch_warnings = [w for w in warnings if w.startswith("Batch")]
+        assert batch_warnings == [
+            "Batch 2: 1 of 1 books failed "
+            "(first: Book 3: Validation error - isbn: String should have at least 1 character)"
+        ]
+
+
+class TestReaders:
+    def test_csv_records_are_parsed_lazily(self, tmp_path):
+        path = tmp_path / "books.csv"
+        _write_csv(path, SAMPLE_ROWS)
+
+        records = bulk_import_module._read_csv_file(path)
+        assert isinstance(records, Iterator)
+        assert next(records)["publication_year"] == 2020
+        assert [r["isbn"] for r in records] == ["9782222222222"]
+
+    def test_csv_reader_keeps_only_known_columns(self, tmp_path):
+        path = tmp_path / "books.csv"
+        path.write_text(
+            "isbn,shelf,title,author_name,description\n"
+            "9781111111111,A3,Short Row\n"
+            "\n"
+            "9782222222222,B1,Full Row,Someone,Long description\n"
+        )
+
+        records = list(bulk_import_module._read_csv_file(path))
+        assert records == [
+            {
+                "isbn": "9781111111111",
+                "title": "Short Row",
+                "author_name": None,
+                "description": None,
+                "available_copies": 1,
+            },
+            {
+                "isbn": "9782222222222",
+                "title": "Full Row",
+                "author_name": "Someone",
+                "description": "Long description",
+                "available_copies": 1,
+            },
+        ]
+
+    def test_csv_record_count_comes_from_line_count(self, tmp_path):
+        path = tmp_path / "books.csv"
+        _write_csv(path, SAMPLE_ROWS)
+        assert bulk_import_module._count_csv_records(path) == 2
+
+        # No trailing newline on the last record
+        path.write_bytes(path.read_bytes().rstrip(b"\r\n"))
+        assert bulk_import_module._count_csv_records(path) == 2
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_parsers_agree(self, tmp_path, monkeypatch, use_orjson):
+        if use_orjson and not bulk_import_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(bulk_import_module, "ORJSON_AVAILABLE", use_orjson)
+        path = tmp_path / "books.json"
+        path.write_text(json.dumps(SAMPLE_ROWS, ensure_ascii=False), encoding="utf-8")
+
+        records, count = bulk_import_module._read_json_file(path)
+        assert count == 2
+        assert list(records) == SAMPLE_ROWS
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_empty_json_file_is_a_parse_error(self, tmp_path, monkeypatch, use_orjson):
+        if use_orjson and not bulk_import_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(bulk_import_module, "ORJSON_AVAILABLE", use_orjson)
+        path = tmp_path / "books.json"
+        path.touch()
+        with pytest.raises(ValueError, match=r"(?i)expect|input"):
+            bulk_import_module._read_json_file(path)
+
+    def test_json_must_be_an_array(self, tmp_path):
+        path = tmp_path / "books.json"
+        path.write_text('{"isbn": "9781111111111"}')
+        with pytest.raises(TypeError, match="array"):
+            bulk_import_module._read_json_file(path)
+
+
+class TestRowValidation:
+    def test_batch_splits_valid_rows_from_problems(self):
+        records = [
+            {"isbn": "978-1 111-11111\t1", "title": "Hyphenated", "author": "Alias Author"},
+            {"isbn": "9782222222222", "title": ""},
+            "not an object",
+            {"isbn": "9783333333333", "title": "Counts", "available_copies": "4", "genre": None},
+        ]
+
+        valid, problems = bulk_import_module._validate_batch(records)
+
+        assert [index for index, _ in valid] == [0, 3]
+        first, last = valid[0][1], valid[1][1]
+        assert first.isbn == "9781111111111"
+        assert first.author_name == "Alias Author"
+        assert (last.genre, last.available_copies, last.total_copies) == ("General", 4, 4)
+        assert last.author_name == "Unknown Author"
+        assert set(problems) == {1, 2}
+        assert problems[1].startswith("title:")
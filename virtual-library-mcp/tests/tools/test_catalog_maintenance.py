@@ -1,9 +1,15 @@
 """Tests for catalog maintenance: progress, ToolResult, and maintenance mode."""
 
+import threading
+from datetime import UTC, date, datetime
+
 import pytest
 from fastmcp import Client
+from sqlalchemy import delete, event, insert, select, text
 
 import server
+import tools.catalog_maintenance as maintenance
+from database.schema import CheckoutRecord, PopularBook
 
 
 @pytest.fixture
@@ -34,6 +40,86 @@ class TestRegenerateCatalog:
         assert data["circulation_stats"]["active_loans"] >= 0
         assert data["recommendations_cache"]["patrons_processed"] == 3
 
+    async def test_search_index_is_rebuilt_from_books(self, client, library):
+        library.execute(text("DELETE FROM books_fts"))
+
+        await client.call_tool("regenerate_catalog", {})
+
+        indexed = library.execute(text("SELECT count(*) FROM books_fts")).scalar()
+        assert indexed == 2
+
+    async def test_database_work_runs_off_the_event_loop(self, client, monkeypatch):
+        threads = []
+
+        def recording(helper):
+            def record(*args):
+                threads.append(threading.current_thread())
+                return helper(*args)
+
+            return record
+
+        for name in ("_catalog_counts", "_rebuild_search_index", "_stream_patrons"):
+            monkeypatch.setattr(maintenance, name, recording(getattr(maintenance, name)))
+
+        await client.call_tool("regenerate_catalog", {})
+
+        assert len(threads) == 3
+        assert threading.main_thread() not in threads
+
+    async def test_patrons_are_streamed_in_batches(self, client, monkeypatch):
+        monkeypatch.setattr(maintenance, "_PATRON_BATCH_SIZE", 2)
+        messages: list[str] = []
+
+        async def on_progress(progress, total, message):
+            messages.append(message)
+
+        result = await client.call_tool("regenerate_catalog", {}, progress_handler=on_progress)
+
+        assert result.structured_content["recommendations_cache"]["patrons_processed"] == 3
+        assert "Generated recommendations for patrons 1-2/3" in messages
+        assert "Generated recommendations for patrons 3-3/3" in messages
+
+    async def test_popular_books_are_ranked_from_checkouts(self, client, library):
+        result = await client.call_tool("regenerate_catalog", {})
+
+        assert result.structured_content["circulation_stats"]["popular_books_updated"] == 1
+        ranking = library.execute(select(PopularBook.book_isbn, PopularBook.rank)).all()
+        assert [tuple(row) for row in ranking] == [("9780134685007", 1)]
+
+    async def test_unchanged_catalog_reuses_the_last_run(self, client, library, monkeypatch):
+        rebuilds = []
+        rebuild = maintenance._rebuild_search_index
+
+        def counting_rebuild(session):
+            rebuilds.append(session)
+            rebuild(session)
+
+        monkeypatch.setattr(maintenance, "_rebuild_search_index", counting_rebuild)
+
+        first = await client.call_tool("regenerate_catalog", {})
+        second = await client.call_tool("regenerate_catalog", {})
+        assert second.structured_content == first.structured_content
+        assert len(rebuilds) == 1
+
+        library.execute(delete(CheckoutRecord))
+        third = await client.call_tool("regenerate_catalog", {})
+        assert third.structured_content["circulation_stats"]["total_circulations"] == 0
+        assert len(rebuilds) == 2
+
+    async def test_stats_only_reports_counts_without_rebuilding(self, client, library, monkeypatch):
+        rebuilds = []
+        monkeypatch.setattr(maintenance, "_rebuild_search_index", rebuilds.append)
+
+        result = await client.call_tool("regenerate_catalog", {"stats_only": True})
+
+        data = result.structured_content
+        assert data["status"] == "stats_only"
+        assert data["catalog"] == {"books": 2, "authors": 1, "genres": 2, "patrons": 3}
+        assert data["circulation_stats"]["total_circulations"] == 1
+        assert "2 books, 1 authors" in result.content[0].text
+        assert rebuilds == []
+        assert library.execute(select(PopularBook)).first() is None
+
     async def test_progress_spans_all_stages(self, client):
         updates: list[float] = []
 
@@ -71,3 +157,81 @@ class TestRegenerateCatalog:
             await asyncio.sleep(0.1)
 
         assert len(seen) >= 2  # one for disable, one for enable
+
+
+class TestCatalogCounts:
+    def test_all_counts_come_from_one_statement(self, library):
+        statements: list[str] = []
+        connection = library.connection()
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(connection, "before_cursor_execute", record)
+        try:
+            counts = maintenance._catalog_counts(library)
+        finally:
+            event.remove(connection, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        expected = {
+            "total_books": 2,
+            "orphaned_books": 0,
+            "unique_genres": 2,
+            "total_circulations": 1,
+            "active_loans": 0,  # the seeded loan is already marked overdue
+            "overdue_loans": 0,
+            "invalid_circulations": 0,
+            "total_authors": 1,
+            "total_patrons": 3,
+        }
+        assert {name: getattr(counts, name) for name in expected} == expected
+
+    def test_loans_with_missing_book_or_patron_are_invalid(self, library):
+        # Foreign keys are only checked at commit, which never comes here.
+        library.execute(text("PRAGMA defer_foreign_keys = ON"))
+        library.execute(
+            insert(CheckoutRecord).values(
+                id="checkout_ghost01",
+                patron_id="patron_ghost01",
+                book_isbn="9780134685007",
+                checkout_date=datetime(2024, 1, 1, tzinfo=UTC),
+                due_date=date(2024, 1, 15),
+            )
+        )
+
+        counts = maintenance._catalog_counts(library)
+
+        assert counts.invalid_circulations == 1
+        assert counts.total_circulations == 2
+
+
+class TestProgressReporter:
+    class RecordingContext:
+        def __init__(self):
+            self.sent: list[tuple[float, str]] = []
+
+        async def report_progress(self, progress, total, message):
+            self.sent.append((progress, message))
+
+    async def test_repeats_of_the_same_percent_are_dropped(self):
+        ctx = self.RecordingContext()
+        reporter = maintenance._ProgressReporter(ctx)
+
+        await reporter.report(progress=20, message="a")
+        await reporter.report(progress=20.5, message="b")
+        await reporter.report(progress=21, message="c")
+        await reporter.report(progress=100, message="d")
+        await reporter.report(progress=100, message="e")
+
+        assert [message for _, message in ctx.sent] == ["a", "c", "d", "e"]
+
+    async def test_same_percent_is_resent_after_the_interval(self, monkeypatch):
+        monkeypatch.setattr(maintenance, "_PROGRESS_INTERVAL", 0)
+        ctx = self.RecordingContext()
+        reporter = maintenance._ProgressReporter(ctx)
+
+        await reporter.report(progress=20, message="a")
+        await reporter.report(progress=20, message="b")
+
+        assert [message for _, message in ctx.sent] == ["a", "b"]
@@ -7,6 +7,9 @@ Highlights:
 - structured output for every circulation operation
 """
 
+import threading
+from datetime import date
+
 import pytest
 from fastmcp import Client
 from fastmcp.exceptions import ToolError
@@ -15,6 +18,7 @@ import server
 from database.schema import Book as BookDB
 from database.schema import CheckoutRecord as CheckoutDB
 from database.schema import Patron as PatronDB
+from tools import circulation
 
 
 @pytest.fixture
@@ -37,6 +41,8 @@ class TestCheckoutBook:
         data = result.structured_content
         assert data["patron_id"] == "patron_clean001"
         assert data["loan_period_days"] == 14
+        due = date.fromisoformat(data["due_date"])
+        assert f"Due {due.strftime('%B %d, %Y')} " in data["message"]
 
         book = library.get(BookDB, "9780134685991")
         assert book.available_copies == 2
@@ -63,6 +69,13 @@ class TestCheckoutBook:
                 "checkout_book", {"patron_id": "patron_clean001", "book_isbn": "not-an-isbn"}
             )
 
+    async def test_checkout_non_ascii_digit_isbn_rejected_by_schema(self, client):
+        # Arabic-Indic digits match a Unicode \d, but are not an ISBN
+        with pytest.raises(ToolError, match="pattern"):
+            await client.call_tool(
+                "checkout_book", {"patron_id": "patron_clean001", "book_isbn": "\u0661" * 13}
+            )
+
 
 class TestCheckoutElicitation:
     """A patron with fines triggers a confirmation elicitation."""
@@ -161,3 +174,28 @@ class TestReserveBook:
                 "reserve_book",
                 {"patron_id": "patron_clean001", "book_isbn": "9999999999999"},
             )
+
+
+class TestOffLoopDatabaseWork:
+    async def test_repository_calls_run_on_worker_threads(self, client, monkeypatch):
+        threads = []
+
+        def recording(helper):
+            def record(*args):
+                threads.append(threading.current_thread())
+                return helper(*args)
+
+            return record
+
+        for name in ("_load_patron", "_checkout", "_reserve"):
+            monkeypatch.setattr(circulation, name, recording(getattr(circulation, name)))
+
+        await client.call_tool(
+            "checkout_book", {"patron_id": "patron_clean001", "book_isbn": "9780134685991"}
+        )
+        await client.call_tool(
+            "reserve_book", {"patron_id": "patron_clean001", "book_isbn": "9780134685007"}
+        )
+
+        assert len(threads) == 3
+        assert threading.main_thread() not in threads
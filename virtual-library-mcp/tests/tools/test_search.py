@@ -5,6 +5,9 @@ they verify what an actual MCP client experiences: the generated input
 schema, structured output, annotations, and ToolError conversion.
 """
 
+import base64
+import json
+
 import pytest
 from fastmcp import Client
 from fastmcp.exceptions import ToolError
@@ -83,6 +86,14 @@ class TestSearchBehavior:
         with pytest.raises(ToolError, match="at least one search criterion"):
             await client.call_tool("search_catalog", {})
 
+    async def test_blank_criteria_never_open_a_session(self, client, monkeypatch):
+        def no_session():
+            raise AssertionError("session opened for an empty search")
+
+        monkeypatch.setattr("tools.search.get_session", no_session)
+        with pytest.raises(ToolError, match="at least one search criterion"):
+            await client.call_tool("search_catalog", {"query": "  ", "genre": "", "author": "\t"})
+
     async def test_schema_rejects_out_of_range_page(self, client):
         with pytest.raises(ToolError):
             await client.call_tool("search_catalog", {"query": "x", "page": 0})
@@ -97,3 +108,35 @@ class TestSearchBehavior:
         assert page["total"] == 2
         assert page["total_pages"] == 2
         assert page["has_next"] is True
+
+    async def test_next_cursor_walks_to_the_following_page(self, client):
+        first = await client.call_tool("search_catalog", {"author": "test", "page_size": 1})
+        cursor = first.structured_content["pagination"]["next_cursor"]
+        assert cursor
+
+        second = await client.call_tool(
+            "search_catalog", {"author": "test", "page_size": 1, "cursor": cursor}
+        )
+        page = second.structured_content["pagination"]
+        assert page["has_next"] is False
+        assert page["next_cursor"] is None
+        summary = second.structured_content["summary"]
+        assert "showing 1 of 2; last page" in summary
+        assert "page 1 of" not in summary
+        isbns = {first.structured_content["books"][0]["isbn"]}
+        isbns.add(second.structured_content["books"][0]["isbn"])
+        assert isbns == {"9780134685991", "9780134685007"}
+
+    async def test_cursor_missing_keys_is_a_tool_error(self, client):
+        forged = base64.urlsafe_b64encode(json.dumps({"v": "a", "i": "x"}).encode()).decode()
+        with pytest.raises(ToolError, match="Malformed search cursor"):
+            await client.call_tool("search_catalog", {"author": "test", "cursor": forged})
+
+    async def test_cursor_from_another_sort_is_a_tool_error(self, client):
+        first = await client.call_tool("search_catalog", {"author": "test", "page_size": 1})
+        cursor = first.structured_content["pagination"]["next_cursor"]
+        with pytest.raises(ToolError, match="different sort order"):
+            await client.call_tool(
+                "search_catalog",
+                {"author": "test", "page_size": 1, "cursor": cursor, "sort_desc": True},
+            )
@@ -11,14 +11,21 @@ LLM to write them (MCP sampling). Demonstrates:
 3. Graceful fallback when the client doesn't support sampling
 """
 
+import asyncio
 import logging
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime
+from types import MappingProxyType
 from typing import Annotated, Literal
 
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from mcp.types import ClientCapabilities, SamplingCapability
 from pydantic import Field
 
-from database.author_repository import AuthorRepository
 from database.book_repository import BookRepository, BookSearchParams
 from database.repository import PaginationParams
 from database.session import session_scope
@@ -27,7 +34,101 @@ from sampling import request_ai_generation
 
 logger = logging.getLogger(__name__)
 
-InsightType = Literal["summary", "themes", "discussion_questions", "similar_books"]
+InsightType = Literal["summary", "themes", "discussion_questions", "similar_books", "all"]
+
+# Sampled insights are memoized so a repeat request skips the client LLM
+# round trip entirely. The key includes the book's updated_at, so editing
+# the book naturally misses the stale entry; the TTL bounds how long any
+# one generation is reused. Fallback content is cheap and never cached.
+_INSIGHT_CACHE_TTL_SECONDS = 3600
+_INSIGHT_CACHE_MAXSIZE = 4096
+_InsightKey = tuple[str, str, datetime | None]
+_insight_cache: OrderedDict[_InsightKey, tuple[float, str]] = OrderedDict()
+
+
+def _cached_insight(key: _InsightKey) -> str | None:
+    entry = _insight_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, text = entry
+    if expires_at <= time.monotonic():
+        del _insight_cache[key]
+        return None
+    _insight_cache.move_to_end(key)
+    return text
+
+
+def _store_insight(key: _InsightKey, text: str) -> None:
+    _insight_cache[key] = (time.monotonic() + _INSIGHT_CACHE_TTL_SECONDS, text)
+    _insight_cache.move_to_end(key)
+    while len(_insight_cache) > _INSIGHT_CACHE_MAXSIZE:
+        _insight_cache.popitem(last=False)  # evict least recently used
+
+
+# Generations currently awaiting the client LLM, keyed like the cache.
+# Concurrent identical requests await the first one's future instead of
+# each issuing their own sampling call.
+_inflight_insights: dict[_InsightKey, asyncio.Future[str | None]] = {}
+
+
+async def _generate_once(
+    key: _InsightKey, generate: Callable[[], Awaitable[str | None]]
+) -> str | None:
+    """Run `generate` unless an identical generation is already in flight."""
+    inflight = _inflight_insights.get(key)
+    if inflight is not None:
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # The leading request was cancelled (not us): generate ourselves
+            current = asyncio.current_task()
+            if not inflight.cancelled() or (current and current.cancelling()):
+                raise
+            return await _generate_once(key, generate)
+
+    future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+    _inflight_insights[key] = future
+    try:
+        result = await generate()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        future.exception()  # mark retrieved: there may be no waiters
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del _inflight_insights[key]
+
+
+# Whether each client session can run sampling requests. Capabilities are
+# fixed by the initialize handshake, so one check per session is enough.
+_session_can_sample: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_SAMPLING_CAPABILITY = ClientCapabilities(sampling=SamplingCapability())
+
+
+def _client_can_sample(ctx: Context) -> bool:
+    """Whether a sampling request from this tool call could be answered."""
+    if not isinstance(ctx, Context):
+        # ModernContext reads capabilities from each request's _meta; there
+        # is no session to remember them on, and ctx.sample() checks cheaply.
+        return True
+    if ctx.fastmcp.sampling_handler is not None:
+        return True  # the server's own handler answers when the client can't
+    session = ctx.session
+    can_sample = _session_can_sample.get(session)
+    if can_sample is None:
+        can_sample = session.check_client_capability(_SAMPLING_CAPABILITY)
+        _session_can_sample[session] = can_sample
+    return can_sample
+
+
+def clear_insight_cache() -> None:
+    """Drop every memoized insight (tests, or after bulk catalog edits)."""
+    _insight_cache.clear()
 
 
 def search_library_catalog(genre: str, limit: int = 8) -> list[dict]:
@@ -54,15 +155,28 @@ def search_library_catalog(genre: str, limit: int = 8) -> list[dict]:
         ]
 
 
+def _load_book_and_author(isbn: str) -> tuple[Book, str] | None:
+    """Fetch a book and its author's name in one short-lived session.
+
+    Returns Pydantic models, which stay usable after the session closes.
+    """
+    with session_scope() as session:
+        return BookRepository(session).get_by_isbn_with_author_name(isbn)
+
+
 async def generate_book_insights(
     isbn: Annotated[
-        str, Field(description="ISBN-13 of the book to generate insights for", pattern=r"^\d{13}$")
+        str,
+        Field(description="ISBN-13 of the book to generate insights for", pattern=r"^[0-9]{13}$"),
     ],
     ctx: Context,
     insight_type: Annotated[
         InsightType,
         Field(
-            description="Kind of insight: summary, themes, discussion_questions, or similar_books"
+            description=(
+                "Kind of insight: summary, themes, discussion_questions, similar_books, "
+                "or all (every kind in one response)"
+            )
         ),
     ] = "summary",
 ) -> str:
@@ -71,91 +185,161 @@ async def generate_book_insights(
     Falls back to genre-based static content when the connected client
     doesn't support sampling, so the tool is useful everywhere.
     """
-    with session_scope() as session:
-        book = BookRepository(session).get_by_isbn(isbn)
-        if not book:
-            raise ToolError(f"Book with ISBN {isbn} not found in the catalog.")
-        author = AuthorRepository(session).get_by_id(book.author_id)
-        author_name = author.name if author else "Unknown Author"
-
-    generators = {
-        "summary": _generate_summary,
-        "themes": _generate_themes,
-        "discussion_questions": _generate_discussion_questions,
-        "similar_books": _generate_similar_books,
-    }
-    result = await generators[insight_type](ctx, book, author_name)
-
-    if result:
-        title = insight_type.replace("_", " ").title()
-        return f"**AI-Generated {title} for '{book.title}'**\n\n{result}"
+    # The lookup is synchronous SQLAlchemy; run it on a worker thread so the
+    # event loop keeps serving other requests (and sampling round-trips).
+    loaded = await asyncio.to_thread(_load_book_and_author, isbn)
+    if loaded is None:
+        raise ToolError(f"Book with ISBN {isbn} not found in the catalog.")
+    book, author_name = loaded
+
+    if insight_type == "all":
+        return await _generate_all_insights(ctx, book, author_name)
+
+    text = await _sampled_insight(ctx, book, author_name, insight_type)
+    if text is not None:
+        return text
     logger.info("Sampling unavailable for %s; serving fallback content", insight_type)
     return _generate_fallback_response(book, author_name, insight_type)
 
 
-async def _generate_summary(ctx: Context, book: Book, author_name: str) -> str | None:
-    prompt = f"""Create an engaging summary for this library book:
+async def _sampled_insight(
+    ctx: Context, book: Book, author_name: str, insight_type: InsightType
+) -> str | None:
+    """One formatted AI-generated insight, or None when sampling gave nothing."""
+    cache_key = (book.isbn, insight_type, book.updated_at)
+    cached = _cached_insight(cache_key)
+    if cached is not None:
+        return cached
+    if not _client_can_sample(ctx):
+        return None
+
+    generate = _GENERATORS[insight_type]
+    result = await _generate_once(cache_key, lambda: generate(ctx, book, author_name))
+    if not result:
+        return None
+
+    title = insight_type.replace("_", " ").title()
+    text = f"**AI-Generated {title} for '{book.title}'**\n\n{result}"
+    _store_insight(cache_key, text)
+    return text
+
+
+async def _generate_all_insights(ctx: Context, book: Book, author_name: str) -> str:
+    """Every insight in one response, with the sampling requests in flight at once.
+
+    Four concurrent requests cost one LLM round trip of latency instead of
+    four. Each section falls back independently, so one failed generation
+    doesn't sink the rest.
+    """
+    results = await asyncio.gather(
+        *(_sampled_insight(ctx, book, author_name, t) for t in _GENERATORS),
+        return_exceptions=True,
+    )
+    sections = [_book_information(book, author_name).rstrip()]
+    for insight_type, result in zip(_GENERATORS, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning("Generating %s failed: %s", insight_type, result)
+        elif result:
+            sections.append(result)
+            continue
+        sections.append(_fallback_section(book, author_name, insight_type))
+    return "\n\n---\n\n".join(sections)
+
+
+# Prompt scaffolds are built once at import; each call only fills the fields.
+_NO_DESCRIPTION = "No description available"
 
-Title: {book.title}
-Author: {author_name}
-Genre: {book.genre}
-Published: {book.publication_year}
-Current description: {book.description or "No description available"}
+_SUMMARY_PROMPT = """Create an engaging summary for this library book:
+
+Title: {title}
+Author: {author}
+Genre: {genre}
+Published: {year}
+Current description: {description}
 
 Generate a compelling 2-3 paragraph summary that would help library patrons
 decide if they want to read this book. Focus on themes, style, and what makes it unique."""
+_SUMMARY_SYSTEM_PROMPT = (
+    "You are a knowledgeable librarian creating book summaries. "
+    "Be informative and engaging without spoilers."
+)
+
+_THEMES_PROMPT = """Analyze the major themes in this book:
+
+Title: {title}
+Author: {author}
+Genre: {genre}
+Description: {description}
 
+Identify and explain 3-5 major themes, each with a brief explanation of how
+the story explores it."""
+_THEMES_SYSTEM_PROMPT = (
+    "You are a literature expert analyzing book themes for library patrons. "
+    "Be insightful but avoid major spoilers."
+)
+
+_DISCUSSION_PROMPT = """Create thoughtful discussion questions for a book club reading:
+
+Title: {title}
+Author: {author}
+Genre: {genre}
+
+Generate 5-7 open-ended questions covering themes, characters, and the
+reader's personal connection to the story."""
+_DISCUSSION_SYSTEM_PROMPT = (
+    "You are a book club facilitator. Make questions thought-provoking and open to interpretation."
+)
+
+_SIMILAR_BOOKS_PROMPT = """Recommend books from THIS library similar to:
+
+Title: {title}
+Author: {author}
+Genre: {genre}
+Description: {description}
+
+Use the search_library_catalog tool to check what the library holds in
+relevant genres, then suggest 3-5 of those titles. For each, explain what
+makes it similar and note whether it is currently available."""
+_SIMILAR_BOOKS_SYSTEM_PROMPT = (
+    "You are a library recommendation expert. Ground every "
+    "recommendation in actual catalog holdings via the provided tool."
+)
+
+
+def _prompt_fields(book: Book, author_name: str) -> dict[str, object]:
+    return {
+        "title": book.title,
+        "author": author_name,
+        "genre": book.genre,
+        "year": book.publication_year,
+        "description": book.description or _NO_DESCRIPTION,
+    }
+
+
+async def _generate_summary(ctx: Context, book: Book, author_name: str) -> str | None:
     return await request_ai_generation(
         ctx,
-        prompt,
-        system_prompt=(
-            "You are a knowledgeable librarian creating book summaries. "
-            "Be informative and engaging without spoilers."
-        ),
+        _SUMMARY_PROMPT.format_map(_prompt_fields(book, author_name)),
+        system_prompt=_SUMMARY_SYSTEM_PROMPT,
         max_tokens=400,
     )
 
 
 async def _generate_themes(ctx: Context, book: Book, author_name: str) -> str | None:
-    prompt = f"""Analyze the major themes in this book:
-
-Title: {book.title}
-Author: {author_name}
-Genre: {book.genre}
-Description: {book.description or "No description available"}
-
-Identify and explain 3-5 major themes, each with a brief explanation of how
-the story explores it."""
-
     return await request_ai_generation(
         ctx,
-        prompt,
-        system_prompt=(
-            "You are a literature expert analyzing book themes for library patrons. "
-            "Be insightful but avoid major spoilers."
-        ),
+        _THEMES_PROMPT.format_map(_prompt_fields(book, author_name)),
+        system_prompt=_THEMES_SYSTEM_PROMPT,
         max_tokens=500,
         temperature=0.6,
     )
 
 
 async def _generate_discussion_questions(ctx: Context, book: Book, author_name: str) -> str | None:
-    prompt = f"""Create thoughtful discussion questions for a book club reading:
-
-Title: {book.title}
-Author: {author_name}
-Genre: {book.genre}
-
-Generate 5-7 open-ended questions covering themes, characters, and the
-reader's personal connection to the story."""
-
     return await request_ai_generation(
         ctx,
-        prompt,
-        system_prompt=(
-            "You are a book club facilitator. Make questions thought-provoking "
-            "and open to interpretation."
-        ),
+        _DISCUSSION_PROMPT.format_map(_prompt_fields(book, author_name)),
+        system_prompt=_DISCUSSION_SYSTEM_PROMPT,
         max_tokens=600,
         temperature=0.8,
     )
@@ -165,24 +349,10 @@ async def _generate_similar_books(ctx: Context, book: Book, author_name: str) ->
     """Tool-enabled sampling (SEP-1577): the client's LLM can call our
     search_library_catalog() tool mid-completion, so every recommendation
     can cite real holdings and availability."""
-    prompt = f"""Recommend books from THIS library similar to:
-
-Title: {book.title}
-Author: {author_name}
-Genre: {book.genre}
-Description: {book.description or "No description available"}
-
-Use the search_library_catalog tool to check what the library holds in
-relevant genres, then suggest 3-5 of those titles. For each, explain what
-makes it similar and note whether it is currently available."""
-
     try:
         result = await ctx.sample(
-            messages=prompt,
-            system_prompt=(
-                "You are a library recommendation expert. Ground every "
-                "recommendation in actual catalog holdings via the provided tool."
-            ),
+            messages=_SIMILAR_BOOKS_PROMPT.format_map(_prompt_fields(book, author_name)),
+            system_prompt=_SIMILAR_BOOKS_SYSTEM_PROMPT,
             max_tokens=700,
             temperature=0.8,
             tools=[search_library_catalog],
@@ -193,37 +363,62 @@ makes it similar and note whether it is currently available."""
     return result.text or None
 
 
-def _generate_fallback_response(book: Book, author_name: str, insight_type: InsightType) -> str:
-    """Meaningful degradation when the client has no sampling support."""
-    base_info = (
+# One generator per individual insight type; insight_type="all" runs them all.
+_GENERATORS: dict[InsightType, Callable[[Context, Book, str], Awaitable[str | None]]] = {
+    "summary": _generate_summary,
+    "themes": _generate_themes,
+    "discussion_questions": _generate_discussion_questions,
+    "similar_books": _generate_similar_books,
+}
+
+
+def _book_information(book: Book, author_name: str) -> str:
+    return (
         f"**Book Information**\n\nTitle: {book.title}\nAuthor: {author_name}\n"
         f"Genre: {book.genre}\nYear: {book.publication_year}\n\n"
     )
 
-    if insight_type == "summary":
-        return base_info + (
-            book.description
-            or "No summary available. AI-generated summaries require a client with sampling support."
-        )
 
-    if insight_type == "themes":
-        fallback_themes = {
+_FALLBACK_THEMES_SECTION = (
+    "**Genre-Typical Themes**\n\n{themes}\n\n"
+    "*Note: AI-generated theme analysis requires a client with sampling support.*"
+)
+# Complete fallback theme sections per genre, rendered once at import.
+# Read-only, since every request shares them.
+_FALLBACK_THEMES_SECTIONS: Mapping[str, str] = MappingProxyType(
+    {
+        genre: _FALLBACK_THEMES_SECTION.format(themes=themes)
+        for genre, themes in {
             "Fiction": "Common themes might include: human nature, relationships, conflict, and personal growth.",
             "Mystery": "Typical themes include: justice, deception, truth, and moral ambiguity.",
             "Science Fiction": "Common themes: technology's impact, human identity, social commentary, and future possibilities.",
             "Fantasy": "Often explores: good vs evil, power and corruption, coming of age, and destiny.",
-        }
-        genre_themes = fallback_themes.get(book.genre, "Themes vary by genre and author style.")
+        }.items()
+    }
+)
+_FALLBACK_THEMES_DEFAULT_SECTION = _FALLBACK_THEMES_SECTION.format(
+    themes="Themes vary by genre and author style."
+)
+
+
+def _generate_fallback_response(book: Book, author_name: str, insight_type: InsightType) -> str:
+    """Meaningful degradation when the client has no sampling support."""
+    return _book_information(book, author_name) + _fallback_section(book, author_name, insight_type)
+
+
+def _fallback_section(book: Book, author_name: str, insight_type: InsightType) -> str:
+    """The insight-specific part of a fallback response."""
+    if insight_type == "summary":
         return (
-            base_info
-            + f"**Genre-Typical Themes**\n\n{genre_themes}\n\n"
-            + "*Note: AI-generated theme analysis requires a client with sampling support.*"
+            book.description
+            or "No summary available. AI-generated summaries require a client with sampling support."
         )
 
+    if insight_type == "themes":
+        return _FALLBACK_THEMES_SECTIONS.get(book.genre, _FALLBACK_THEMES_DEFAULT_SECTION)
+
     if insight_type == "discussion_questions":
-        return (
-            base_info
-            + """**Generic Discussion Questions**
+        return """**Generic Discussion Questions**
 
 1. What was your overall impression of this book?
 2. Which character did you relate to most and why?
@@ -232,11 +427,8 @@ def _generate_fallback_response(book: Book, author_name: str, insight_type: Insi
 5. How did the book's setting influence the story?
 
 *Note: AI-generated discussion questions tailored to this specific book require a client with sampling support.*"""
-        )
 
-    return (
-        base_info
-        + f"""**Finding Similar Books**
+    return f"""**Finding Similar Books**
 
 To find books similar to this one, consider:
 - Other books by {author_name}
@@ -244,4 +436,3 @@ To find books similar to this one, consider:
 - Books from the same era ({book.publication_year}s)
 
 *Note: AI-generated personalized recommendations require a client with sampling support.*"""
-    )
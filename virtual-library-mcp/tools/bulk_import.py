@@ -10,27 +10,81 @@ resolved and checked against the allowed root before opening.
 """
 
 import csv
+import itertools
 import json
 import logging
+import mmap
+import os
 import time
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import Annotated, Any
 
 import anyio
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
-from pydantic import Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
+from sqlalchemy import delete, exists, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 
 from database.schema import Author as AuthorDB
 from database.schema import Book as BookDB
 from database.session import session_scope
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Only files under the project's data/ directory may be imported.
 ALLOWED_IMPORT_ROOT = (Path(__file__).parent.parent / "data").resolve()
 
+# CSV columns BookRow understands; any others are ignored.
+_CSV_COLUMNS = frozenset(
+    {
+        "isbn",
+        "title",
+        "author_name",
+        "author",
+        "authors",
+        "genre",
+        "publication_year",
+        "available_copies",
+        "total_copies",
+        "description",
+    }
+)
+
+# Error messages included in the import summary.
+_MAX_REPORTED_ERRORS = 10
+
+# Separators people type inside ISBNs, dropped in one str.translate pass.
+_ISBN_STRIP = str.maketrans("", "", "- \t")
+
+# Book rows whose ISBN is already taken are skipped by the database, and
+# RETURNING names the rows that did go in.
+_INSERT_NEW_BOOKS = (
+    sqlite_insert(BookDB).on_conflict_do_nothing(index_elements=["isbn"]).returning(BookDB.isbn)
+)
+
+
+def _record_errors(errors: list[str], new_errors: list[str]) -> None:
+    """Append messages to the summary's error list, up to its cap."""
+    errors.extend(new_errors[: _MAX_REPORTED_ERRORS - len(errors)])
+
 
 def _confine_to_import_root(file_path: str) -> Path:
     """Resolve a user-supplied path and require it to live under data/.
@@ -97,83 +151,131 @@ async def bulk_import_books(
 
     await ctx.info(f"Starting import from {path.name}")
 
-    # Read and parse the file
-    books_data = _read_csv_file(path) if file_type == ".csv" else _read_json_file(path)
-
-    total_books = len(books_data)
-    await ctx.info(f"Found {total_books} books to import")
+    # Records are parsed as the batches consume them, so at most one batch
+    # of parsed rows is alive at a time. The count up front only sizes the
+    # progress bar; total_books is tallied from the records actually read.
+    if file_type == ".csv":
+        books_data = _read_csv_file(path)
+        expected_books = await anyio.to_thread.run_sync(_count_csv_records, path)
+    else:
+        books_data, expected_books = await anyio.to_thread.run_sync(_read_json_file, path)
+    await ctx.info(f"Found {expected_books} books to import")
 
     # Process books in batches
+    total_books = 0
     successful = 0
     failed = 0
-    errors = []
-    start_time = time.time()
+    # Only the first few messages reach the summary, so only those are kept;
+    # error_count stays exact however many more there are.
+    errors: list[str] = []
+    error_count = 0
+    total_batches = (expected_books + batch_size - 1) // batch_size
+    start_time = time.monotonic()
+
+    # Reading the file and every database round trip run in a worker thread
+    # (one at a time, so the session is never shared), keeping the event loop
+    # free to deliver this import's notifications and serve other requests.
+    # anyio waits for a running thread to finish before honouring
+    # cancellation, so session_scope never cleans up under a live statement.
+    batches = itertools.batched(books_data, batch_size)
 
     with session_scope() as session:
-        for i in range(0, total_books, batch_size):
-            batch = books_data[i : i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (total_books + batch_size - 1) // batch_size
+        # Every author lookup is answered from memory: one SELECT up front,
+        # then each author the import creates is added as it goes.
+        author_ids_by_name, taken_author_ids = await anyio.to_thread.run_sync(
+            _load_author_lookups, session
+        )
+
+        for batch_num in itertools.count(1):
+            batch = await anyio.to_thread.run_sync(next, batches, None)
+            if batch is None:
+                break
+            i = total_books
+            total_books += len(batch)
 
             await ctx.info(f"Processing batch {batch_num}/{total_batches}")
 
-            for j, book_data in enumerate(batch):
-                current_book = i + j + 1
+            # Validate the batch into flat column mappings first, so the
+            # database sees one multi-row INSERT per table instead of an ORM
+            # flush per book.
+            author_rows: list[dict[str, Any]] = []
+            book_rows: list[dict[str, Any]] = []
+            row_numbers: list[int] = []
+            batch_errors: list[str] = []
 
-                # Calculate ETA
-                elapsed_time = time.time() - start_time
-                if current_book > 1 and elapsed_time > 0:
-                    avg_time_per_book = elapsed_time / (current_book - 1)
-                    remaining_books = total_books - current_book + 1
-                    eta_seconds = avg_time_per_book * remaining_books
-                    eta_str = f" - ETA: {_format_eta(eta_seconds)}"
-                else:
-                    eta_str = ""
-
-                # Report progress with ETA
-                await ctx.report_progress(
-                    progress=current_book,
-                    total=total_books,
-                    message=f"Importing book {current_book}/{total_books}{eta_str}",
-                )
+            valid_rows, problems = _validate_batch(batch)
+            for j, problem in problems.items():
+                batch_errors.append(f"Book {i + j + 1}: Validation error - {problem}")
 
-                try:
-                    # Each book gets its own SAVEPOINT so one bad row
-                    # (e.g. duplicate ISBN) can't poison the whole batch.
-                    with session.begin_nested():
-                        _create_book_in_db(session, book_data)
-                    successful += 1
-
-                except ValueError as e:
-                    failed += 1
-                    error_msg = f"Book {current_book}: Validation error - {e!s}"
-                    errors.append(error_msg)
-                    await ctx.warning(error_msg)
-
-                except IntegrityError:
-                    failed += 1
-                    error_msg = f"Book {current_book}: Database error - Book may already exist"
-                    errors.append(error_msg)
-                    await ctx.warning(error_msg)
-
-                except Exception as e:
-                    failed += 1
-                    error_msg = f"Book {current_book}: Unexpected error - {e!s}"
-                    errors.append(error_msg)
-                    await ctx.error(error_msg)
-
-            # Commit batch
+            for j, row in valid_rows:
+                current_book = i + j + 1
+                author_name = row.author_name
+                book_row = row.model_dump(exclude={"author_name"})
+
+                author_id = author_ids_by_name.get(author_name)
+                if author_id is None:
+                    author_id = _new_author_id(author_name, taken_author_ids)
+                    taken_author_ids.add(author_id)
+                    author_ids_by_name[author_name] = author_id
+                    author_rows.append(
+                        {
+                            "id": author_id,
+                            "name": author_name,
+                            "biography": f"Author of {book_row['title']}",
+                        }
+                    )
+
+                book_row["author_id"] = author_id
+                book_rows.append(book_row)
+                row_numbers.append(current_book)
+
+            failed += len(batch_errors)
             try:
-                session.commit()
-                await ctx.debug(f"Committed batch {batch_num}")
+                batch_inserted, row_errors, unused_author_ids = await anyio.to_thread.run_sync(
+                    _write_batch, session, author_rows, book_rows, row_numbers
+                )
+                batch_errors.extend(row_errors)
+                _forget_authors(
+                    [row for row in author_rows if row["id"] in unused_author_ids],
+                    author_ids_by_name,
+                    taken_author_ids,
+                )
             except Exception as e:
-                session.rollback()
-                batch_failed = len(batch)
-                failed += batch_failed
-                successful -= batch_failed
-                error_msg = f"Failed to commit batch {batch_num}: {e!s}"
-                errors.append(error_msg)
+                await anyio.to_thread.run_sync(session.rollback)
+                _forget_authors(author_rows, author_ids_by_name, taken_author_ids)
+                failed += len(book_rows)
+                error_msg = f"Failed to import batch {batch_num}: {e!s}"
+                _record_errors(errors, [error_msg])
+                error_count += 1
                 await ctx.error(error_msg)
+            else:
+                successful += batch_inserted
+                failed += len(book_rows) - batch_inserted
+                await ctx.debug(f"Committed batch {batch_num}")
+
+            # Per-row problems are reported once per batch, not one
+            # notification each; the summary carries the individual messages.
+            _record_errors(errors, batch_errors)
+            error_count += len(batch_errors)
+            if batch_errors:
+                await ctx.warning(
+                    f"Batch {batch_num}: {len(batch_errors)} of {len(batch)} books failed "
+                    f"(first: {batch_errors[0]})"
+                )
+
+            # One progress notification per batch, with the ETA extrapolated
+            # from the average time per book so far.
+            elapsed_time = time.monotonic() - start_time
+            remaining_books = max(expected_books - total_books, 0)
+            eta_seconds = elapsed_time / total_books * remaining_books
+            await ctx.report_progress(
+                progress=total_books,
+                total=max(expected_books, total_books),
+                message=(
+                    f"Imported batch {batch_num}/{total_batches} - "
+                    f"{total_books}/{expected_books} books - ETA: {_format_eta(eta_seconds)}"
+                ),
+            )
 
     # Final progress report
     await ctx.report_progress(progress=total_books, total=total_books, message="Import completed")
@@ -184,8 +286,8 @@ async def bulk_import_books(
         "successful_imports": successful,
         "failed_imports": failed,
         "success_rate": f"{(successful / total_books) * 100:.1f}%" if total_books > 0 else "0%",
-        "errors": errors[:10] if errors else [],  # Limit errors in response
-        "errors_truncated": len(errors) > 10,
+        "errors": errors,
+        "errors_truncated": error_count > len(errors),
     }
 
     if failed > 0:
@@ -196,87 +298,268 @@ async def bulk_import_books(
     return summary
 
 
-def _read_csv_file(path: Path) -> list[dict[str, Any]]:
-    """Read books data from a CSV file."""
-    books = []
+def _count_csv_records(path: Path) -> int:
+    """Count a CSV file's data rows by counting lines, without parsing it.
+
+    Used only to size progress reports: a quoted field spanning lines (or
+    a blank line) makes it an overestimate, never an underestimate.
+    """
+    lines = 0
+    last = b"\n"
+    with path.open("rb") as f:
+        while chunk := f.read(1 << 20):
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        lines += 1  # final line without a trailing newline
+    return max(lines - 1, 0)  # minus the header
+
+
+def _read_csv_file(path: Path) -> Iterator[dict[str, Any]]:
+    """Read books data from a CSV file, one record at a time."""
     with path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        # Resolve the columns the importer reads to positions once; rows are
+        # plain lists indexed by position, and other columns are never copied.
+        columns = [(name, i) for i, name in enumerate(header) if name in _CSV_COLUMNS]
+
         for row in reader:
+            if not row:
+                continue  # blank line
+            width = len(row)
+            record = {name: row[i] if i < width else None for name, i in columns}
+
             # Convert year to int if present
-            if row.get("publication_year"):
+            if record.get("publication_year"):
                 try:
-                    row["publication_year"] = int(row["publication_year"])
+                    record["publication_year"] = int(record["publication_year"])
                 except ValueError:
                     pass
 
             # Convert available_copies to int if present
-            if row.get("available_copies"):
+            if record.get("available_copies"):
                 try:
-                    row["available_copies"] = int(row["available_copies"])
+                    record["available_copies"] = int(record["available_copies"])
                 except ValueError:
-                    row["available_copies"] = 1
+                    record["available_copies"] = 1
             else:
-                row["available_copies"] = 1
+                record["available_copies"] = 1
+
+            yield record
+
+
+def _parse_json(path: Path) -> Any:
+    """Parse a JSON file with orjson when installed (the ``speed`` extra).
+
+    orjson parses straight out of a memory map of the file, so the document
+    is never copied into a bytes object first; the stdlib needs real bytes.
+    """
+    if not ORJSON_AVAILABLE:
+        return json.loads(path.read_bytes())
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:  # mmap rejects empty files
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
 
-            books.append(row)
-    return books
 
+def _read_json_file(path: Path) -> tuple[Iterator[dict[str, Any]], int]:
+    """Read books data from a JSON file, returning (records, record count).
 
-def _read_json_file(path: Path) -> list[dict[str, Any]]:
-    """Read books data from a JSON file."""
-    with path.open(encoding="utf-8") as f:
-        data = json.load(f)
+    The array is parsed in one go (the stdlib has no streaming parser), but
+    records are handed out through an iterator like the CSV path.
+    """
+    data = _parse_json(path)
 
     if not isinstance(data, list):
         raise TypeError("JSON file must contain an array of book objects")
 
-    return data
+    return iter(data), len(data)
 
 
-def _create_book_in_db(session, data: dict[str, Any]) -> None:
-    """Create a book in the database, handling author creation/lookup."""
-    # Handle author name variations
-    author_name = (
-        data.get("author_name") or data.get("author") or data.get("authors", "Unknown Author")
-    )
+class BookRow(BaseModel):
+    """One import record, validated and normalized into books-table columns.
 
-    # Ensure required fields
-    if not data.get("isbn"):
-        raise ValueError("ISBN is required")
-    if not data.get("title"):
-        raise ValueError("Title is required")
-
-    # Find or create author
-    author = session.query(AuthorDB).filter_by(name=author_name).first()
-    if not author:
-        # Create a simple author ID based on the name
-        author_id = f"author_{author_name.lower().replace(' ', '_')[:20]}"
-        # Check if this ID already exists
-        existing = session.query(AuthorDB).filter_by(id=author_id).first()
-        if existing:
-            # Add a number suffix to make it unique
-            counter = 1
-            while session.query(AuthorDB).filter_by(id=f"{author_id}_{counter}").first():
-                counter += 1
-            author_id = f"{author_id}_{counter}"
-
-        author = AuthorDB(
-            id=author_id,
-            name=author_name,
-            biography=f"Author of {data.get('title', 'various works')}",
+    Accepts the CSV/JSON field names; the author may also be given as
+    ``author`` or ``authors``. Unknown fields are ignored.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    isbn: str = Field(min_length=1)
+    title: str = Field(min_length=1)
+    author_name: str = "Unknown Author"
+    genre: str = "General"
+    publication_year: int | None = None
+    available_copies: int = 1
+    total_copies: int | None = None
+    description: str | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _apply_defaults(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        # A missing CSV cell arrives as None; treat it like an absent field
+        data = {key: value for key, value in data.items() if value is not None}
+        data["author_name"] = (
+            data.get("author_name") or data.get("author") or data.get("authors") or "Unknown Author"
         )
-        session.add(author)
-        session.flush()  # Ensure author ID is available
-
-    # Create the book
-    book = BookDB(
-        isbn=data["isbn"].replace("-", ""),  # Normalize ISBN
-        title=data["title"],
-        author_id=author.id,
-        genre=data.get("genre", "General"),
-        publication_year=data.get("publication_year"),
-        available_copies=data.get("available_copies", 1),
-        total_copies=data.get("total_copies", data.get("available_copies", 1)),
-        description=data.get("description"),
-    )
-    session.add(book)
+        return data
+
+    @field_validator("isbn")
+    @classmethod
+    def _normalize_isbn(cls, isbn: str) -> str:
+        return isbn.translate(_ISBN_STRIP)
+
+    @model_validator(mode="after")
+    def _default_total_copies(self) -> "BookRow":
+        if self.total_copies is None:
+            self.total_copies = self.available_copies
+        return self
+
+
+# Built once: validating a whole batch is a single call into pydantic-core.
+_BOOK_ROWS = TypeAdapter(list[BookRow])
+
+
+def _validate_batch(records: Sequence[Any]) -> tuple[list[tuple[int, BookRow]], dict[int, str]]:
+    """Validate a batch of records in one pass.
+
+    Returns ([(index, row)] for the valid records, {index: problem} for the
+    rest). Only a batch with problems is validated a second time, without
+    the offending records.
+    """
+    try:
+        return list(enumerate(_BOOK_ROWS.validate_python(records))), {}
+    except ValidationError as exc:
+        problems: dict[int, str] = {}
+        for error in exc.errors():
+            index, *field = error["loc"]
+            where = f"{field[0]}: " if field else ""
+            problems.setdefault(index, f"{where}{error['msg']}")
+
+    valid = [index for index in range(len(records)) if index not in problems]
+    rows = _BOOK_ROWS.validate_python([records[index] for index in valid])
+    return list(zip(valid, rows, strict=True)), problems
+
+
+def _load_author_lookups(session) -> tuple[dict[str, str], set[str]]:
+    """Read every author once: ({name: id}, {taken ids})."""
+    author_ids_by_name: dict[str, str] = {}
+    taken_author_ids: set[str] = set()
+    for author_id, author_name in session.execute(select(AuthorDB.id, AuthorDB.name)):
+        author_ids_by_name.setdefault(author_name, author_id)
+        taken_author_ids.add(author_id)
+    return author_ids_by_name, taken_author_ids
+
+
+def _write_batch(
+    session,
+    author_rows: list[dict[str, Any]],
+    book_rows: list[dict[str, Any]],
+    row_numbers: list[int],
+) -> tuple[int, list[str], set[str]]:
+    """Insert one batch's new authors and books and commit it (blocking).
+
+    New authors go in first so the books can reference them. Any new author
+    left without a book (every one of its rows was skipped or failed) is
+    deleted again before the commit, so a failed row never leaves an
+    orphaned author behind.
+
+    Returns (books inserted, per-row error messages, IDs of new authors
+    that were dropped again).
+    """
+    if author_rows:
+        session.execute(insert(AuthorDB), author_rows)
+    inserted, errors = _insert_book_rows(session, book_rows, row_numbers) if book_rows else (0, [])
+    unused_author_ids: set[str] = set()
+    if author_rows and inserted < len(book_rows):
+        unused_author_ids = set(
+            session.scalars(
+                delete(AuthorDB)
+                .where(
+                    AuthorDB.id.in_([row["id"] for row in author_rows]),
+                    ~exists().where(BookDB.author_id == AuthorDB.id),
+                )
+                .returning(AuthorDB.id)
+            )
+        )
+    session.commit()
+    return inserted, errors, unused_author_ids
+
+
+def _new_author_id(author_name: str, taken_ids: set[str]) -> str:
+    """Derive an unused author ID from the name, suffixing a counter on collision."""
+    base_id = f"author_{author_name.lower().replace(' ', '_')[:20]}"
+    author_id = base_id
+    counter = 0
+    while author_id in taken_ids:
+        counter += 1
+        author_id = f"{base_id}_{counter}"
+    return author_id
+
+
+def _forget_authors(
+    author_rows: list[dict[str, Any]],
+    author_ids_by_name: dict[str, str],
+    taken_author_ids: set[str],
+) -> None:
+    """Drop a rolled-back batch's new authors from the in-memory lookups."""
+    for row in author_rows:
+        author_ids_by_name.pop(row["name"], None)
+        taken_author_ids.discard(row["id"])
+
+
+def _insert_book_rows(
+    session, book_rows: list[dict[str, Any]], row_numbers: list[int]
+) -> tuple[int, list[str]]:
+    """Insert a batch of book rows, returning (inserted, per-row error messages).
+
+    The batch goes in as one INSERT ... ON CONFLICT (isbn) DO NOTHING, so
+    ISBNs already in the catalog (or earlier in the file) are skipped by the
+    database instead of raising; RETURNING reports which rows went in. Only
+    a different constraint failure (e.g. a CHECK) falls back to inserting
+    row by row, each in its own SAVEPOINT, to pin down the offending rows.
+    """
+    try:
+        with session.begin_nested():
+            inserted_isbns = set(session.scalars(_INSERT_NEW_BOOKS, book_rows))
+    except IntegrityError:
+        return _insert_book_rows_one_by_one(session, book_rows, row_numbers)
+
+    inserted = 0
+    errors = []
+    for row_number, row in zip(row_numbers, book_rows, strict=True):
+        if row["isbn"] in inserted_isbns:
+            inserted_isbns.discard(row["isbn"])  # a repeat later in the batch was skipped
+            inserted += 1
+        else:
+            errors.append(_duplicate_isbn_error(row_number, row))
+    return inserted, errors
+
+
+def _insert_book_rows_one_by_one(
+    session, book_rows: list[dict[str, Any]], row_numbers: list[int]
+) -> tuple[int, list[str]]:
+    """Slow path of _insert_book_rows: one SAVEPOINT per row."""
+    inserted = 0
+    errors = []
+    for row_number, row in zip(row_numbers, book_rows, strict=True):
+        try:
+            with session.begin_nested():
+                if session.scalars(_INSERT_NEW_BOOKS, [row]).first() is None:
+                    errors.append(_duplicate_isbn_error(row_number, row))
+                    continue
+            inserted += 1
+        except IntegrityError as e:
+            errors.append(f"Book {row_number}: Database error - {e.orig}")
+    return inserted, errors
+
+
+def _duplicate_isbn_error(row_number: int, row: dict[str, Any]) -> str:
+    return f"Book {row_number}: ISBN {row['isbn']} already exists"
@@ -4,20 +4,39 @@ This module demonstrates multi-stage progress notifications during
 long-running maintenance operations.
 """
 
-import asyncio
 import logging
-from typing import Any
+import time
+from datetime import date
+from typing import Annotated, Any
 
+import anyio
 from fastmcp import Context
 from fastmcp.tools import ToolResult
-from sqlalchemy import func
+from pydantic import Field
+from sqlalchemy import (
+    Date,
+    Row,
+    ScalarResult,
+    and_,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+)
+from sqlalchemy.orm import Session
 
-from database.circulation_repository import CirculationRepository
-from database.patron_repository import PatronRepository
-from database.repository import PaginationParams
 from database.schema import Author as AuthorDB
 from database.schema import Book as BookDB
-from database.schema import CheckoutRecord
+from database.schema import (
+    CheckoutRecord,
+    CirculationStatusEnum,
+    PopularBook,
+    rebuild_book_search_index,
+)
+from database.schema import Patron as PatronDB
 from database.session import session_scope
 
 # Observability is handled by middleware, not decorators
@@ -25,16 +44,119 @@ from database.session import session_scope
 logger = logging.getLogger(__name__)
 
 
+# Minimum spacing between progress updates that report the same percent.
+_PROGRESS_INTERVAL = 0.1
+
+# Books kept in the popular_books ranking.
+_POPULAR_BOOKS_LIMIT = 50
+
+# Patrons loaded per round trip while building the recommendations cache.
+_PATRON_BATCH_SIZE = 100
+
+# A finished run is reused while nothing it summarizes has changed. The key
+# is the whole _catalog_counts row, which carries each table's row counts and
+# newest updated_at, so inserts, deletes and edits all miss the cached entry;
+# the TTL bounds how long one run is reused regardless.
+_RESULT_CACHE_TTL_SECONDS = 300
+_result_cache: dict[tuple[Any, ...], tuple[float, dict[str, Any]]] = {}
+
+# Statements are built once at import; each call only binds parameters.
+_books = select(
+    func.count(BookDB.isbn).label("total_books"),
+    func.count(case((BookDB.author_id.is_(None), 1))).label("orphaned_books"),
+    func.count(func.distinct(BookDB.genre)).label("unique_genres"),
+    func.max(BookDB.updated_at).label("books_changed_at"),
+).subquery()
+
+# Loans whose book or patron no longer exists, found with outer joins on the
+# two primary keys rather than a correlated EXISTS pair per row.
+_is_active = CheckoutRecord.status == CirculationStatusEnum.ACTIVE
+_is_overdue = and_(_is_active, CheckoutRecord.due_date < bindparam("today", type_=Date))
+_is_invalid = or_(BookDB.isbn.is_(None), PatronDB.id.is_(None))
+_checkouts = (
+    select(
+        func.count(CheckoutRecord.id).label("total_circulations"),
+        func.count(case((_is_active, 1))).label("active_loans"),
+        func.count(case((_is_overdue, 1))).label("overdue_loans"),
+        func.count(case((_is_invalid, 1))).label("invalid_circulations"),
+        func.max(CheckoutRecord.updated_at).label("checkouts_changed_at"),
+    )
+    .select_from(CheckoutRecord)
+    .outerjoin(BookDB, CheckoutRecord.book_isbn == BookDB.isbn)
+    .outerjoin(PatronDB, CheckoutRecord.patron_id == PatronDB.id)
+    .subquery()
+)
+
+_authors = select(
+    func.count(AuthorDB.id).label("total_authors"),
+    func.max(AuthorDB.updated_at).label("authors_changed_at"),
+).subquery()
+_patrons = select(
+    func.count(PatronDB.id).label("total_patrons"),
+    func.max(PatronDB.updated_at).label("patrons_changed_at"),
+).subquery()
+
+_CATALOG_COUNTS = select(_books, _checkouts, _authors, _patrons)
+
+_checkout_count = func.count(CheckoutRecord.id)
+_by_popularity = (_checkout_count.desc(), CheckoutRecord.book_isbn)
+_INSERT_POPULAR_BOOKS = insert(PopularBook).from_select(
+    ["book_isbn", "checkout_count", "rank"],
+    select(
+        CheckoutRecord.book_isbn,
+        _checkout_count,
+        func.row_number().over(order_by=_by_popularity),
+    )
+    .join(BookDB, CheckoutRecord.book_isbn == BookDB.isbn)
+    .group_by(CheckoutRecord.book_isbn)
+    .order_by(*_by_popularity)
+    .limit(_POPULAR_BOOKS_LIMIT),
+)
+
 # The resource taken offline while its cache rebuilds (maintenance mode).
 RECOMMENDATIONS_RESOURCE = "Personalized Book Recommendations"
 
 
-async def regenerate_catalog(ctx: Context) -> ToolResult:
+class _ProgressReporter:
+    """Forwards progress to the client, dropping updates that add nothing.
+
+    An update goes out when the whole-percent value changes, when
+    _PROGRESS_INTERVAL has passed since the last one, or when the run is
+    complete; anything else would repaint the same progress bar.
+    """
+
+    def __init__(self, ctx: Context) -> None:
+        self._ctx = ctx
+        self._last_percent = -1
+        self._last_sent = 0.0
+
+    async def report(self, progress: float, message: str) -> None:
+        percent = int(progress)
+        now = time.monotonic()
+        if (
+            percent == self._last_percent
+            and now - self._last_sent < _PROGRESS_INTERVAL
+            and percent < 100
+        ):
+            return
+        self._last_percent = percent
+        self._last_sent = now
+        await self._ctx.report_progress(progress=progress, total=100, message=message)
+
+
+async def regenerate_catalog(
+    ctx: Context,
+    stats_only: Annotated[
+        bool,
+        Field(description="Only report catalog statistics; skip rebuilding indexes and caches"),
+    ] = False,
+) -> ToolResult:
     """Perform full catalog maintenance with live progress reporting.
 
     Four stages, each reporting progress: data integrity (0-20%), search
     indexes (20-50%), circulation statistics (50-80%), and the
-    recommendations cache (80-100%).
+    recommendations cache (80-100%). With stats_only, the numbers come back
+    from a single query and nothing is rebuilt.
 
     MCP concepts on display:
     - Progress notifications across a long-running operation
@@ -46,6 +168,24 @@ async def regenerate_catalog(ctx: Context) -> ToolResult:
       clients can run it asynchronously and poll for the result
     """
     await ctx.info("Starting catalog regeneration")
+    reporter = _ProgressReporter(ctx)
+
+    # Every statement runs in a worker thread so the event loop stays free
+    # to deliver progress notifications and serve other requests.
+    with session_scope() as session:
+        counts = await anyio.to_thread.run_sync(_catalog_counts, session)
+
+    if stats_only:
+        result = _catalog_statistics(counts)
+        await reporter.report(progress=100, message="Catalog statistics collected")
+        return ToolResult(content=_format_statistics(result), structured_content=result)
+
+    cache_key = tuple(counts)
+    result = _cached_result(cache_key)
+    if result is not None:
+        await reporter.report(progress=100, message="Catalog unchanged since last regeneration")
+        await ctx.info("Catalog unchanged since the last regeneration; reusing its results")
+        return ToolResult(content=_format_summary(result), structured_content=result)
 
     # MAINTENANCE MODE: hide the recommendations template from this session
     # while its cache is being rebuilt. ctx.disable_components() and the
@@ -54,20 +194,20 @@ async def regenerate_catalog(ctx: Context) -> ToolResult:
     await ctx.disable_components(names={RECOMMENDATIONS_RESOURCE}, components={"template"})
     try:
         await ctx.info("Stage 1: Verifying data integrity")
-        integrity_results = await _verify_data_integrity(ctx, 0, 20)
+        integrity_results = await _verify_data_integrity(ctx, reporter, counts, 0, 20)
 
         await ctx.info("Stage 2: Rebuilding search indexes")
-        index_results = await _rebuild_search_indexes(ctx, 20, 50)
+        index_results = await _rebuild_search_indexes(ctx, reporter, counts, 20, 50)
 
         await ctx.info("Stage 3: Updating circulation statistics")
-        stats_results = await _update_circulation_stats(ctx, 50, 80)
+        stats_results = await _update_circulation_stats(ctx, reporter, counts, 50, 80)
 
         await ctx.info("Stage 4: Generating recommendations cache")
-        cache_results = await _generate_recommendations_cache(ctx, 80, 100)
+        cache_results = await _generate_recommendations_cache(ctx, reporter, counts, 80, 100)
     finally:
         await ctx.reset_visibility()
 
-    await ctx.report_progress(progress=100, total=100, message="Catalog regeneration complete")
+    await reporter.report(progress=100, message="Catalog regeneration complete")
     await ctx.info("Catalog regeneration completed successfully")
 
     result = {
@@ -78,9 +218,73 @@ async def regenerate_catalog(ctx: Context) -> ToolResult:
         "recommendations_cache": cache_results,
         "message": "Catalog regeneration completed successfully",
     }
+    _store_result(cache_key, result)
     return ToolResult(content=_format_summary(result), structured_content=result)
 
 
+def _cached_result(key: tuple[Any, ...]) -> dict[str, Any] | None:
+    entry = _result_cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return entry[1]
+
+
+def _store_result(key: tuple[Any, ...], result: dict[str, Any]) -> None:
+    # Only the latest run can still match the catalog, so it replaces the rest
+    _result_cache.clear()
+    _result_cache[key] = (time.monotonic() + _RESULT_CACHE_TTL_SECONDS, result)
+
+
+def clear_result_cache() -> None:
+    """Forget the last regeneration, so the next call runs every stage."""
+    _result_cache.clear()
+
+
+def _catalog_statistics(counts: Row) -> dict[str, Any]:
+    """The numbers a full run reports, read straight from the counts row."""
+    return {
+        "status": "stats_only",
+        "integrity_check": {
+            "books_checked": counts.total_books,
+            "orphaned_books": counts.orphaned_books,
+            "missing_authors": 0,
+            "invalid_circulations": counts.invalid_circulations,
+        },
+        "catalog": {
+            "books": counts.total_books,
+            "authors": counts.total_authors,
+            "genres": counts.unique_genres,
+            "patrons": counts.total_patrons,
+        },
+        "circulation_stats": {
+            "active_loans": counts.active_loans,
+            "overdue_loans": counts.overdue_loans,
+            "total_circulations": counts.total_circulations,
+        },
+        "message": "Catalog statistics collected; no maintenance was run",
+    }
+
+
+def _format_statistics(result: dict[str, Any]) -> str:
+    """Human-readable statistics report for the stats_only text block."""
+    catalog = result["catalog"]
+    circulation = result["circulation_stats"]
+    integrity = result["integrity_check"]
+    return "\n".join(
+        [
+            "Catalog statistics (no maintenance run):",
+            "",
+            f"- Catalog: {catalog['books']} books, {catalog['authors']} authors, "
+            f"{catalog['genres']} genres, {catalog['patrons']} patrons",
+            f"- Circulation: {circulation['active_loans']} active loans, "
+            f"{circulation['overdue_loans']} overdue, "
+            f"{circulation['total_circulations']} total",
+            f"- Integrity: {integrity['orphaned_books']} orphaned books, "
+            f"{integrity['invalid_circulations']} invalid circulations",
+        ]
+    )
+
+
 def _format_summary(result: dict[str, Any]) -> str:
     """Human-readable maintenance report for the text content block."""
     lines = [
@@ -104,8 +308,22 @@ def _format_summary(result: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _catalog_counts(session: Session) -> Row:
+    """Every count the maintenance stages report, in a single SELECT.
+
+    Each table is aggregated once with conditional counts, and the
+    one-row aggregates are cross-joined into one result row. Each table's
+    newest updated_at rides along, so the row also fingerprints the catalog.
+    """
+    return session.execute(_CATALOG_COUNTS, {"today": date.today()}).one()
+
+
 async def _verify_data_integrity(
-    ctx: Context, start_progress: int, end_progress: int
+    ctx: Context,
+    reporter: _ProgressReporter,
+    counts: Row,
+    start_progress: int,
+    end_progress: int,
 ) -> dict[str, Any]:
     """Verify data integrity with progress reporting."""
     results = {
@@ -115,111 +333,92 @@ async def _verify_data_integrity(
         "invalid_circulations": 0,
     }
 
-    with session_scope() as session:
-        # Count total books for progress
-        total_books = session.query(func.count(BookDB.isbn)).scalar() or 0
-        results["books_checked"] = total_books
+    results["books_checked"] = counts.total_books
 
-        # Check for orphaned books (no author)
-        await ctx.report_progress(
-            progress=start_progress + 5, total=100, message="Checking for orphaned books"
-        )
-
-        orphaned = (
-            session.query(func.count(BookDB.isbn)).filter(BookDB.author_id.is_(None)).scalar() or 0
-        )
-        results["orphaned_books"] = orphaned
+    # Check for orphaned books (no author)
+    await reporter.report(progress=start_progress + 5, message="Checking for orphaned books")
 
-        if orphaned > 0:
-            await ctx.warning(f"Found {orphaned} books without authors")
+    orphaned = counts.orphaned_books
+    results["orphaned_books"] = orphaned
 
-        # Check for invalid circulations
-        await ctx.report_progress(
-            progress=start_progress + 10, total=100, message="Validating circulation records"
-        )
+    if orphaned > 0:
+        await ctx.warning(f"Found {orphaned} books without authors")
 
-        # Find circulations with non-existent books or patrons
-        invalid_circs = (
-            session.query(func.count(CheckoutRecord.id))
-            .filter(~CheckoutRecord.book.has() | ~CheckoutRecord.patron.has())
-            .scalar()
-            or 0
-        )
-        results["invalid_circulations"] = invalid_circs
+    # Check for circulations with non-existent books or patrons
+    await reporter.report(progress=start_progress + 10, message="Validating circulation records")
 
-        if invalid_circs > 0:
-            await ctx.warning(f"Found {invalid_circs} invalid circulation records")
+    invalid_circs = counts.invalid_circulations
+    results["invalid_circulations"] = invalid_circs
 
-        # Simulate additional checks
-        await asyncio.sleep(0.2)  # Simulate processing time
+    if invalid_circs > 0:
+        await ctx.warning(f"Found {invalid_circs} invalid circulation records")
 
-        await ctx.report_progress(
-            progress=end_progress, total=100, message="Data integrity check complete"
-        )
+    await reporter.report(progress=end_progress, message="Data integrity check complete")
 
     return results
 
 
 async def _rebuild_search_indexes(
-    ctx: Context, start_progress: int, end_progress: int
+    ctx: Context,
+    reporter: _ProgressReporter,
+    counts: Row,
+    start_progress: int,
+    end_progress: int,
 ) -> dict[str, Any]:
     """Rebuild search indexes with progress reporting."""
     results = {"books_indexed": 0, "authors_indexed": 0, "genres_indexed": 0}
 
-    with session_scope() as session:
-        # Index books
-        total_books = session.query(func.count(BookDB.isbn)).scalar() or 0
-        results["books_indexed"] = total_books
-
-        # Simulate indexing in batches
-        batch_size = 100
-        progress_range = end_progress - start_progress
-
-        for i in range(0, total_books, batch_size):
-            current_batch = min(i + batch_size, total_books)
-            progress = start_progress + int((i / total_books) * progress_range * 0.6)
-
-            await ctx.report_progress(
-                progress=progress,
-                total=100,
-                message=f"Indexing books {i + 1}-{current_batch}/{total_books}",
-            )
+    progress_range = end_progress - start_progress
 
-            # Simulate indexing time
-            await asyncio.sleep(0.1)
+    # Index books: the full-text index is refilled from the books table
+    # in one INSERT ... SELECT rather than batch by batch.
+    total_books = counts.total_books
+    results["books_indexed"] = total_books
 
-        # Index authors
-        await ctx.report_progress(
-            progress=start_progress + int(progress_range * 0.7),
-            total=100,
-            message="Indexing authors",
-        )
+    await reporter.report(
+        progress=start_progress + int(progress_range * 0.1),
+        message=f"Indexing {total_books} books",
+    )
 
-        total_authors = session.query(func.count(AuthorDB.id)).scalar() or 0
-        results["authors_indexed"] = total_authors
-        await asyncio.sleep(0.1)
+    with session_scope() as session:
+        await anyio.to_thread.run_sync(_rebuild_search_index, session)
 
-        # Index genres
-        await ctx.report_progress(
-            progress=start_progress + int(progress_range * 0.9),
-            total=100,
-            message="Indexing genres",
-        )
+    # Index authors
+    await reporter.report(
+        progress=start_progress + int(progress_range * 0.7),
+        message="Indexing authors",
+    )
 
-        unique_genres = session.query(func.count(func.distinct(BookDB.genre))).scalar() or 0
-        results["genres_indexed"] = unique_genres
-        await asyncio.sleep(0.1)
+    total_authors = counts.total_authors
+    results["authors_indexed"] = total_authors
 
-        await ctx.report_progress(
-            progress=end_progress, total=100, message="Search indexes rebuilt"
-        )
+    # Index genres
+    await reporter.report(
+        progress=start_progress + int(progress_range * 0.9),
+        message="Indexing genres",
+    )
+
+    unique_genres = counts.unique_genres
+    results["genres_indexed"] = unique_genres
+
+    await reporter.report(progress=end_progress, message="Search indexes rebuilt")
 
     await ctx.info(f"Indexed {total_books} books, {total_authors} authors, {unique_genres} genres")
     return results
 
 
+def _rebuild_search_index(session: Session) -> None:
+    """Refill books_fts and commit, all on the calling (worker) thread."""
+    rebuild_book_search_index(session.connection())
+    session.commit()
+
+
 async def _update_circulation_stats(
-    ctx: Context, start_progress: int, end_progress: int
+    ctx: Context,
+    reporter: _ProgressReporter,
+    counts: Row,
+    start_progress: int,
+    end_progress: int,
 ) -> dict[str, Any]:
     """Update circulation statistics with progress reporting."""
     results = {
@@ -229,97 +428,101 @@ async def _update_circulation_stats(
         "popular_books_updated": 0,
     }
 
-    with session_scope() as session:
-        repo = CirculationRepository(session)
+    # Count active and overdue loans
+    await reporter.report(progress=start_progress + 5, message="Counting active loans")
 
-        # Count active and overdue loans from circulation statistics
-        await ctx.report_progress(
-            progress=start_progress + 5, total=100, message="Counting active loans"
-        )
+    results["active_loans"] = counts.active_loans
 
-        stats = repo.get_circulation_stats()
-        results["active_loans"] = stats.active_checkouts
+    await reporter.report(progress=start_progress + 10, message="Checking for overdue loans")
 
-        await ctx.report_progress(
-            progress=start_progress + 10, total=100, message="Checking for overdue loans"
-        )
+    results["overdue_loans"] = counts.overdue_loans
 
-        results["overdue_loans"] = stats.overdue_checkouts
+    if results["overdue_loans"] > 0:
+        await ctx.warning(f"Found {results['overdue_loans']} overdue loans")
 
-        if results["overdue_loans"] > 0:
-            await ctx.warning(f"Found {results['overdue_loans']} overdue loans")
+    # Update total circulation count
+    await reporter.report(progress=start_progress + 20, message="Updating circulation totals")
 
-        # Update total circulation count
-        await ctx.report_progress(
-            progress=start_progress + 20, total=100, message="Updating circulation totals"
-        )
+    results["total_circulations"] = counts.total_circulations
 
-        total_circs = session.query(func.count(CheckoutRecord.id)).scalar() or 0
-        results["total_circulations"] = total_circs
+    # Rebuild the popular books cache
+    await reporter.report(progress=end_progress - 5, message="Updating popular books cache")
 
-        # Simulate updating popular books cache
-        await ctx.report_progress(
-            progress=end_progress - 5, total=100, message="Updating popular books cache"
+    with session_scope() as session:
+        results["popular_books_updated"] = await anyio.to_thread.run_sync(
+            _refresh_popular_books, session
         )
 
-        # In a real system, this would update a cache table
-        results["popular_books_updated"] = 50  # Simulate top 50 books
-        await asyncio.sleep(0.2)
-
-        await ctx.report_progress(
-            progress=end_progress, total=100, message="Circulation statistics updated"
-        )
+    await reporter.report(progress=end_progress, message="Circulation statistics updated")
 
     return results
 
 
+def _refresh_popular_books(session: Session) -> int:
+    """Re-rank popular_books from checkout history; returns the rows written.
+
+    The old ranking is deleted and the new one computed and stored by a
+    single INSERT ... SELECT, so no checkout rows pass through Python.
+    """
+    session.execute(delete(PopularBook))
+    result = session.execute(_INSERT_POPULAR_BOOKS)
+    session.commit()
+    return result.rowcount
+
+
 async def _generate_recommendations_cache(
-    ctx: Context, start_progress: int, end_progress: int
+    ctx: Context,
+    reporter: _ProgressReporter,
+    counts: Row,
+    start_progress: int,
+    end_progress: int,
 ) -> dict[str, Any]:
     """Generate recommendations cache with progress reporting."""
     results = {"patrons_processed": 0, "recommendations_generated": 0, "cache_size_kb": 0}
 
-    with session_scope() as session:
-        patron_repo = PatronRepository(session)
-
-        # Get all patrons (paged API; one page is plenty for this library)
-        all_patrons = patron_repo.get_all(pagination=PaginationParams(page=1, page_size=100))
-        total_patrons = len(all_patrons.items)
-
-        # Process patrons in batches
-        batch_size = 10
-        progress_range = end_progress - start_progress
-        recommendations_count = 0
-
-        for i in range(0, total_patrons, batch_size):
-            batch_end = min(i + batch_size, total_patrons)
-            batch = all_patrons.items[i:batch_end]
+    total_patrons = counts.total_patrons
+    progress_range = end_progress - start_progress
+    recommendations_count = 0
+    processed = 0
 
-            progress = start_progress + int((i / total_patrons) * progress_range)
-
-            await ctx.report_progress(
-                progress=progress,
-                total=100,
-                message=f"Generating recommendations for patrons {i + 1}-{batch_end}/{total_patrons}",
+    with session_scope() as session:
+        # Patrons are streamed a batch at a time, so memory stays bounded by
+        # the batch size however many patrons the library has.
+        patrons = await anyio.to_thread.run_sync(_stream_patrons, session)
+        batches = patrons.partitions()
+
+        while True:
+            batch = await anyio.to_thread.run_sync(next, batches, None)
+            if batch is None:
+                break
+
+            # In a real system, this would generate actual recommendations
+            recommendations_count += len(batch) * 5  # Assume 5 recommendations per patron
+            processed += len(batch)
+
+            # min/max: patrons added since the count can outrun it
+            done = min(processed, total_patrons) / max(total_patrons, 1)
+            await reporter.report(
+                progress=start_progress + int(done * progress_range),
+                message=(
+                    f"Generated recommendations for patrons "
+                    f"{processed - len(batch) + 1}-{processed}/{total_patrons}"
+                ),
             )
 
-            # Simulate recommendation generation
-            for _ in batch:
-                # In a real system, this would generate actual recommendations
-                recommendations_count += 5  # Assume 5 recommendations per patron
+    results["patrons_processed"] = processed
+    results["recommendations_generated"] = recommendations_count
+    results["cache_size_kb"] = recommendations_count * 2  # Estimate 2KB per recommendation
 
-            await asyncio.sleep(0.1)  # Simulate processing time
+    await reporter.report(progress=end_progress, message="Recommendations cache generated")
 
-        results["patrons_processed"] = total_patrons
-        results["recommendations_generated"] = recommendations_count
-        results["cache_size_kb"] = recommendations_count * 2  # Estimate 2KB per recommendation
+    await ctx.info(f"Generated {recommendations_count} recommendations for {processed} patrons")
 
-        await ctx.report_progress(
-            progress=end_progress, total=100, message="Recommendations cache generated"
-        )
+    return results
 
-        await ctx.info(
-            f"Generated {recommendations_count} recommendations for {total_patrons} patrons"
-        )
 
-    return results
+def _stream_patrons(session: Session) -> ScalarResult[PatronDB]:
+    """All patrons, fetched from the cursor one batch at a time as consumed."""
+    return session.execute(
+        select(PatronDB), execution_options={"yield_per": _PATRON_BATCH_SIZE}
+    ).scalars()
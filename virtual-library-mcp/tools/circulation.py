@@ -14,6 +14,7 @@ MCP concepts demonstrated:
   ToolError so the model can recover, instead of opaque protocol errors.
 """
 
+import asyncio
 import logging
 from datetime import date, datetime, timedelta
 from typing import Annotated, Literal
@@ -26,11 +27,14 @@ from database.circulation_repository import (
     CheckoutCreateSchema,
     CirculationRepository,
     ReservationCreateSchema,
+    ReservationQueueInfo,
     ReturnProcessSchema,
 )
 from database.patron_repository import PatronRepository
 from database.repository import NotFoundError, RepositoryException
 from database.session import get_session
+from models.circulation import CheckoutRecord, ReservationRecord, ReturnRecord
+from models.patron import Patron
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +42,29 @@ PATRON_ID_FIELD = Field(
     description="Patron identifier, e.g. 'patron_00042'",
     pattern=r"^patron_[a-zA-Z0-9_]{5,}$",
 )
-ISBN_FIELD = Field(description="ISBN-13 of the book (13 digits)", pattern=r"^\d{13}$")
+ISBN_FIELD = Field(description="ISBN-13 of the book (13 digits)", pattern=r"^[0-9]{13}$")
+
+# Month names for confirmation messages: a table lookup instead of the
+# locale-dependent strftime("%B"), which also keeps the text English.
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+def _long_date(d: date) -> str:
+    """Format a date like 'March 05, 2025' (same as strftime('%B %d, %Y'))."""
+    return f"{_MONTHS[d.month - 1]} {d.day:02d}, {d.year}"
 
 
 def _log_operation(operation: str, **kwargs) -> None:
@@ -48,6 +74,34 @@ def _log_operation(operation: str, **kwargs) -> None:
     )
 
 
+# ---------------------------------------------------------------------------
+# Blocking database work — each helper owns its session and runs on a worker
+# thread (asyncio.to_thread), so concurrent tool calls interleave instead of
+# queueing behind one another's SQLAlchemy round-trips.
+# ---------------------------------------------------------------------------
+
+
+def _load_patron(patron_id: str) -> Patron | None:
+    with get_session() as session:
+        return PatronRepository(session).get_by_id(patron_id)
+
+
+def _checkout(data: CheckoutCreateSchema) -> CheckoutRecord:
+    with get_session() as session:
+        return CirculationRepository(session).checkout_book(data)
+
+
+def _return(data: ReturnProcessSchema) -> ReturnRecord:
+    with get_session() as session:
+        return_record, _ = CirculationRepository(session).return_book(data)
+        return return_record
+
+
+def _reserve(data: ReservationCreateSchema) -> tuple[ReservationRecord, ReservationQueueInfo]:
+    with get_session() as session:
+        return CirculationRepository(session).create_reservation_with_queue(data)
+
+
 # ---------------------------------------------------------------------------
 # Structured output models — these become each tool's outputSchema
 # ---------------------------------------------------------------------------
@@ -127,8 +181,7 @@ async def checkout_book(
     # ELICITATION (MCP 2025-11-25): when a patron carries fines but is still
     # allowed to borrow, defer the judgment call to the human. The request
     # travels server -> client -> user and execution pauses for the answer.
-    with get_session() as session:
-        patron = PatronRepository(session).get_by_id(patron_id)
+    patron = await asyncio.to_thread(_load_patron, patron_id)
     if patron is not None and 0 < patron.outstanding_fines <= 10.0:
         try:
             answer = await ctx.elicit(
@@ -146,24 +199,25 @@ async def checkout_book(
                     f"the patron has ${patron.outstanding_fines:.2f} in fines."
                 )
 
-    with get_session() as session:
-        repo = CirculationRepository(session)
-        try:
-            checkout = repo.checkout_book(
-                CheckoutCreateSchema(
-                    patron_id=patron_id, book_isbn=book_isbn, due_date=due_date, notes=notes
-                )
-            )
-        except NotFoundError as e:
-            _log_operation("checkout_book_failed", patron_id=patron_id, error="not_found")
-            raise ToolError(str(e)) from e
-        except RepositoryException as e:
-            _log_operation("checkout_book_failed", patron_id=patron_id, error="business_rule")
-            raise ToolError(str(e)) from e
+    try:
+        # model_construct: FastMCP already validated these arguments
+        # against the tool signature, which is at least as strict.
+        checkout = await asyncio.to_thread(
+            _checkout,
+            CheckoutCreateSchema.model_construct(
+                patron_id=patron_id, book_isbn=book_isbn, due_date=due_date, notes=notes
+            ),
+        )
+    except NotFoundError as e:
+        _log_operation("checkout_book_failed", patron_id=patron_id, error="not_found")
+        raise ToolError(str(e)) from e
+    except RepositoryException as e:
+        _log_operation("checkout_book_failed", patron_id=patron_id, error="business_rule")
+        raise ToolError(str(e)) from e
 
     message = (
         f"Checked out '{checkout.book_isbn}' to {checkout.patron_id}. "
-        f"Due {checkout.due_date.strftime('%B %d, %Y')} "
+        f"Due {_long_date(checkout.due_date)} "
         f"({checkout.loan_period_days}-day loan)."
     )
     _log_operation(
@@ -218,21 +272,21 @@ async def return_book(
     """
     _log_operation("return_book_start", checkout_id=checkout_id, condition=condition)
 
-    with get_session() as session:
-        repo = CirculationRepository(session)
-        try:
-            return_record, _ = repo.return_book(
-                ReturnProcessSchema(
-                    checkout_id=checkout_id,
-                    condition=condition,
-                    notes=notes,
-                    processed_by="mcp_tool",
-                )
-            )
-        except NotFoundError as e:
-            raise ToolError(str(e)) from e
-        except RepositoryException as e:
-            raise ToolError(str(e)) from e
+    try:
+        # Arguments were validated against the tool signature
+        return_record = await asyncio.to_thread(
+            _return,
+            ReturnProcessSchema.model_construct(
+                checkout_id=checkout_id,
+                condition=condition,
+                notes=notes,
+                processed_by="mcp_tool",
+            ),
+        )
+    except NotFoundError as e:
+        raise ToolError(str(e)) from e
+    except RepositoryException as e:
+        raise ToolError(str(e)) from e
 
     if rating or review:
         logger.info("Review received | rating=%s review=%s", rating, (review or "")[:100])
@@ -297,22 +351,21 @@ async def reserve_book(
 
     _log_operation("reserve_book_start", patron_id=patron_id, book_isbn=book_isbn)
 
-    with get_session() as session:
-        repo = CirculationRepository(session)
-        try:
-            reservation = repo.create_reservation(
-                ReservationCreateSchema(
-                    patron_id=patron_id,
-                    book_isbn=book_isbn,
-                    expiration_date=expiration_date,
-                    notes=notes,
-                )
-            )
-            queue_info = repo.get_reservation_queue_info(book_isbn)
-        except NotFoundError as e:
-            raise ToolError(str(e)) from e
-        except RepositoryException as e:
-            raise ToolError(str(e)) from e
+    try:
+        # Arguments were validated against the tool signature
+        reservation, queue_info = await asyncio.to_thread(
+            _reserve,
+            ReservationCreateSchema.model_construct(
+                patron_id=patron_id,
+                book_isbn=book_isbn,
+                expiration_date=expiration_date,
+                notes=notes,
+            ),
+        )
+    except NotFoundError as e:
+        raise ToolError(str(e)) from e
+    except RepositoryException as e:
+        raise ToolError(str(e)) from e
 
     message = (
         f"Reserved '{reservation.book_isbn}' for {reservation.patron_id}. "
@@ -320,7 +373,7 @@ async def reserve_book(
     )
     if queue_info.estimated_wait_days:
         message += f" (estimated wait: {queue_info.estimated_wait_days} days)"
-    message += f". Expires {reservation.expiration_date.strftime('%B %d, %Y')}."
+    message += f". Expires {_long_date(reservation.expiration_date)}."
 
     _log_operation(
         "reserve_book_success",